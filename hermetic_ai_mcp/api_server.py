@@ -303,8 +303,8 @@ async def search_memory(request: MemorySearchRequest):
         "memories": [
             {
                 "id": m.id,
-                "scope": m.scope.value,
-                "type": m.type.value,
+                "scope": m.scope_value,
+                "type": m.type_value,
                 "content": m.content,
                 "metadata": m.metadata,
                 "created": m.created_at,
@@ -424,7 +424,7 @@ async def chat_completions(request: ChatCompletionRequest):
             memories = server.platform.memory_system.search(query, limit=5)
             response_content = f"Found {len(memories)} memories:\n"
             for m in memories:
-                response_content += f"- {m.type.value}: {m.content[:100]}...\n"
+                response_content += f"- {m.type_value}: {m.content[:100]}...\n"
             function_name = "search_memory"
             function_args = {"query": query}
             
@@ -6,16 +6,27 @@ import sqlite3
 import json
 import time
 import hashlib
+import functools
+import threading
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _synchronized(method):
+    """Run a DualLayerMemorySystem method holding the instance lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class MemoryType(Enum):
     """Types of memory entries"""
     PATTERN = "pattern"
@@ -48,8 +59,13 @@ class MemoryEntry:
     accessed_count: int = 0
     confidence_score: float = 1.0
     project_hash: Optional[str] = None
+    # Plain-string copies of type.value/scope.value (enum .value is a slow descriptor)
+    type_value: str = field(init=False, repr=False, compare=False)
+    scope_value: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
+        self.type_value = self.type.value
+        self.scope_value = self.scope.value
         if self.created_at is None:
             self.created_at = time.time()
         if self.id is None:
@@ -79,6 +95,11 @@ class DualLayerMemorySystem:
         self.universal_dir.mkdir(parents=True, exist_ok=True)
         self.projects_dir.mkdir(parents=True, exist_ok=True)
         
+        # The connections are shared across threads (check_same_thread=False),
+        # so every public method that touches them holds this lock; a commit
+        # from one thread must never land in the middle of another's batch
+        self._lock = threading.RLock()
+        
         # Initialize databases
         self.universal_conn = None
         self.project_conn = None
@@ -232,6 +253,7 @@ class DualLayerMemorySystem:
         
         self.project_conn.commit()
     
+    @_synchronized
     def set_project(self, project_hash: str):
         """
         Set the current project for memory operations
@@ -252,6 +274,7 @@ class DualLayerMemorySystem:
         
         logger.info(f"Project memory set to: {project_hash}")
     
+    @_synchronized
     def store(self, 
               content: str, 
               memory_type: MemoryType,
@@ -291,7 +314,64 @@ class DualLayerMemorySystem:
         
         return entry
     
-    def _store_universal(self, entry: MemoryEntry):
+    @_synchronized
+    def store_many(self, items: List[Tuple[str, MemoryType, MemoryScope, Optional[Dict[str, Any]]]]) -> List[MemoryEntry]:
+        """
+        Store several memory entries, committing once per database
+        
+        All-or-nothing: if any entry fails, nothing from the batch is kept.
+        Pattern usage is tracked only after the batch commits.
+        
+        Args:
+            items: (content, memory_type, scope, metadata) tuples
+            
+        Returns:
+            Created MemoryEntry objects, in input order
+        """
+        if not self.current_project_hash and any(
+            scope == MemoryScope.PROJECT for _, _, scope, _ in items
+        ):
+            raise ValueError("No project set for project-scoped memory")
+        
+        entries = []
+        touched = set()
+        try:
+            for content, memory_type, scope, metadata in items:
+                entry = MemoryEntry(
+                    id=None,
+                    scope=scope,
+                    type=memory_type,
+                    content=content,
+                    metadata=metadata if metadata is not None else {},
+                    project_hash=self.current_project_hash if scope == MemoryScope.PROJECT else None
+                )
+                # Mark the connection before storing: an entry can take two
+                # INSERTs, and a failure after the first must be rolled back too
+                if scope == MemoryScope.UNIVERSAL:
+                    touched.add(self.universal_conn)
+                    self._store_universal(entry, commit=False)
+                elif scope == MemoryScope.PROJECT:
+                    touched.add(self.project_conn)
+                    self._store_project(entry, commit=False)
+                entries.append(entry)
+        except Exception:
+            for conn in touched:
+                conn.rollback()
+            for entry in entries:
+                cache = self._universal_cache if entry.scope == MemoryScope.UNIVERSAL else self._project_cache
+                cache.pop(entry.id, None)
+            raise
+        
+        for conn in touched:
+            conn.commit()
+        
+        for entry in entries:
+            if entry.scope == MemoryScope.PROJECT:
+                self._track_pattern_usage(entry)
+        
+        return entries
+    
+    def _store_universal(self, entry: MemoryEntry, commit: bool = True):
         """Store in universal memory"""
         cursor = self.universal_conn.cursor()
         
@@ -341,19 +421,20 @@ class DualLayerMemorySystem:
             VALUES (?, ?, ?, ?, ?, ?)
         """, (
             entry.id,
-            entry.type.value,
+            entry.type_value,
             entry.content,
             json.dumps(entry.metadata),
             entry.created_at,
             entry.confidence_score
         ))
         
-        self.universal_conn.commit()
+        if commit:
+            self.universal_conn.commit()
         
         # Update cache
         self._universal_cache[entry.id] = entry
     
-    def _store_project(self, entry: MemoryEntry):
+    def _store_project(self, entry: MemoryEntry, commit: bool = True):
         """Store in project-specific memory"""
         if not self.project_conn:
             raise ValueError("No project database initialized")
@@ -394,20 +475,23 @@ class DualLayerMemorySystem:
             VALUES (?, ?, ?, ?, ?, ?)
         """, (
             entry.id,
-            entry.type.value,
+            entry.type_value,
             entry.content,
             json.dumps(entry.metadata),
             entry.metadata.get('file_path', ''),
             entry.created_at
         ))
         
-        self.project_conn.commit()
+        if commit:
+            self.project_conn.commit()
         
         # Update cache
         self._project_cache[entry.id] = entry
         
-        # Track pattern usage for potential promotion
-        self._track_pattern_usage(entry)
+        # Track pattern usage for potential promotion; batched stores do this
+        # after their commit, since a promotion commits the universal database
+        if commit:
+            self._track_pattern_usage(entry)
     
     def _track_pattern_usage(self, entry: MemoryEntry):
         """Track pattern usage across projects for promotion"""
@@ -437,6 +521,7 @@ class DualLayerMemorySystem:
         
         # Change scope and store in universal
         entry.scope = MemoryScope.UNIVERSAL
+        entry.scope_value = entry.scope.value
         entry.metadata['promoted'] = True
         entry.metadata['source_projects'] = list(
             self.pattern_usage.get(entry.id[:8], {}).get('projects', [])
@@ -444,6 +529,7 @@ class DualLayerMemorySystem:
         
         self._store_universal(entry)
     
+    @_synchronized
     def search(self, 
                query: str, 
                scope: MemoryScope = None,
@@ -475,6 +561,36 @@ class DualLayerMemorySystem:
         results.sort(key=lambda x: x.confidence_score, reverse=True)
         return results[:limit]
     
+    @_synchronized
+    def list_recent(self,
+                    scope: MemoryScope = None,
+                    limit: int = 10,
+                    memory_type: MemoryType = None) -> List[MemoryEntry]:
+        """
+        List the most recently stored memories, newest first
+        
+        Same rows as search(query="*"), without the relevance re-sort and
+        without touching a layer the scope excludes.
+        
+        Args:
+            scope: Optional scope filter
+            limit: Maximum results
+            memory_type: Optional type filter
+            
+        Returns:
+            List of MemoryEntry objects
+        """
+        if scope == MemoryScope.UNIVERSAL:
+            return self._search_universal("*", memory_type, limit)
+        if scope == MemoryScope.PROJECT:
+            return self._search_project("*", memory_type, limit)
+        
+        results = self._search_universal("*", memory_type, limit)
+        if self.project_conn:
+            results.extend(self._search_project("*", memory_type, limit))
+        results.sort(key=lambda x: x.created_at, reverse=True)
+        return results[:limit]
+    
     def _search_universal(self, query: str, memory_type: MemoryType = None, limit: int = 10) -> List[MemoryEntry]:
         """Search universal memory"""
         cursor = self.universal_conn.cursor()
@@ -563,6 +679,7 @@ class DualLayerMemorySystem:
         
         return results
     
+    @_synchronized
     def get_relevant_context(self, query: str, max_tokens: int = 4000) -> Dict[str, Any]:
         """
         Get relevant context for a query, combining universal and project memories
@@ -597,8 +714,8 @@ class DualLayerMemorySystem:
             
             context['memories'].append({
                 'content': entry.content,
-                'type': entry.type.value,
-                'scope': entry.scope.value,
+                'type': entry.type_value,
+                'scope': entry.scope_value,
                 'metadata': entry.metadata
             })
             current_tokens += entry_tokens
@@ -606,6 +723,7 @@ class DualLayerMemorySystem:
         context['token_count'] = current_tokens
         return context
     
+    @_synchronized
     def export_universal_knowledge(self) -> Dict[str, Any]:
         """Export all universal knowledge for backup or sharing"""
         cursor = self.universal_conn.cursor()
@@ -635,6 +753,7 @@ class DualLayerMemorySystem:
         
         return export
     
+    @_synchronized
     def close(self):
         """Close database connections"""
         if self.universal_conn:
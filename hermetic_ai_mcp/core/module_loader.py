@@ -3,17 +3,47 @@ Dynamic Module Loader System
 Handles plugin discovery, loading, and lifecycle management
 """
 import os
+import sys
 import importlib
 import importlib.util
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Type
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple, Type, Union
+from dataclasses import dataclass, field
 import json
+import pickle
 import logging
-import inspect
+import functools
+import contextlib
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-@dataclass
+
+# Entry point package for modules shipped with the platform
+_BUILTIN_PACKAGE = "hermetic_ai_mcp.modules"
+
+# Bump when the discovery cache's layout changes so stale caches are discarded
+_DISCOVERY_CACHE_VERSION = 3
+
+# Fields module.json must provide (enabled has a default)
+_REQUIRED_METADATA_FIELDS = frozenset(
+    ("name", "version", "description", "author", "dependencies", "entry_point")
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _import_entry(entry_point: str):
+    """Resolve a built-in module entry point, memoized across loads"""
+    return importlib.import_module(entry_point)
+
+
+@dataclass(slots=True)
 class ModuleMetadata:
     """Module metadata"""
     name: str
@@ -23,6 +53,16 @@ class ModuleMetadata:
     dependencies: List[str]
     entry_point: str
     enabled: bool = True
+    is_builtin: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Resolved once here instead of on every load
+        self.is_builtin = self.entry_point.startswith(_BUILTIN_PACKAGE)
+
+
+def _metadata_from_dict(metadata_dict: Dict[str, Any]) -> ModuleMetadata:
+    """Build ModuleMetadata from a module.json dict without sharing its mutable values"""
+    return ModuleMetadata(**{**metadata_dict, "dependencies": list(metadata_dict["dependencies"])})
 
 
 class ModuleInterface:
@@ -55,6 +95,24 @@ class ModuleInterface:
         pass
 
 
+# Classes registered by @hermetic_module while this thread executes a module
+_discovery_state = threading.local()
+
+
+def hermetic_module(cls: Type[ModuleInterface]) -> Type[ModuleInterface]:
+    """
+    Mark a ModuleInterface subclass as its module's entry class
+    
+    Classes registered while the loader executes a module are used directly,
+    skipping the namespace scan for ModuleInterface subclasses.
+    """
+    cls.__hermetic_module__ = True
+    registered = getattr(_discovery_state, "classes", None)
+    if registered is not None:
+        registered.append(cls)
+    return cls
+
+
 class ModuleLoader:
     """Dynamic module loader and manager"""
     
@@ -70,7 +128,59 @@ class ModuleLoader:
         
         self.loaded_modules: Dict[str, ModuleInterface] = {}
         self.module_metadata: Dict[str, ModuleMetadata] = {}
-        self.module_errors: Dict[str, str] = {}
+        # Plain messages, or (context, exc_type, exc_value) formatted lazily in get_status()
+        self.module_errors: Dict[str, Union[str, Tuple[str, type, BaseException]]] = {}
+        
+        # Parsed module.json cache persisted across runs: path -> (mtime_ns, size, json dict);
+        # holds the file's contents, never the live metadata objects handed out. Named after
+        # the modules dir so sibling loaders don't prune each other's entries as stale
+        self._discovery_cache_path = self.modules_dir.parent / f".discovery_cache.{self.modules_dir.name}.pkl"
+        self._discovery_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = self._load_discovery_cache()
+        self._discovery_cache_dirty = False
+        self._bulk_depth = 0
+        
+        # Bumped on every load/unload; keys the merged tool/command caches
+        self._modules_version = 0
+        self._tools_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._commands_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        
+        # Built-in entry points that failed to import, so retries skip the import system
+        self._import_failures: Dict[str, Tuple[type, BaseException]] = {}
+        
+        # Guards loaded_modules/version updates when loads run on worker threads
+        self._load_lock = threading.Lock()
+    
+    def _load_discovery_cache(self) -> Dict[str, Tuple[int, int, Dict[str, Any]]]:
+        """Load the persisted discovery cache, discarding it if unreadable"""
+        try:
+            version, cache = pickle.loads(self._discovery_cache_path.read_bytes())
+        except Exception:
+            return {}
+        return cache if version == _DISCOVERY_CACHE_VERSION and isinstance(cache, dict) else {}
+    
+    def flush(self) -> None:
+        """Persist the discovery cache if it changed since the last flush"""
+        if not self._discovery_cache_dirty:
+            return
+        try:
+            self._discovery_cache_path.write_bytes(
+                pickle.dumps((_DISCOVERY_CACHE_VERSION, self._discovery_cache), protocol=pickle.HIGHEST_PROTOCOL)
+            )
+            self._discovery_cache_dirty = False
+        except OSError:
+            # Cache is an optimization only - discovery still works without it
+            pass
+    
+    @contextlib.contextmanager
+    def bulk_update(self):
+        """Defer discovery cache writes until the outermost block exits"""
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth:
+                self.flush()
     
     def discover_modules(self) -> List[ModuleMetadata]:
         """
@@ -80,20 +190,44 @@ class ModuleLoader:
             List of discovered module metadata
         """
         discovered = []
+        seen_paths = set()
         
         # Check modules directory
         for item in self.modules_dir.iterdir():
             if item.is_dir():
                 metadata_file = item / "module.json"
-                if metadata_file.exists():
+                try:
+                    st = metadata_file.stat()
+                except OSError:
+                    continue
+                
+                cache_key = str(metadata_file)
+                seen_paths.add(cache_key)
+                cached = self._discovery_cache.get(cache_key)
+                if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    # Fresh object per discovery: runtime changes (e.g. enabled)
+                    # must not leak into the cache or across restarts
+                    metadata = _metadata_from_dict(cached[2])
+                else:
                     try:
-                        with open(metadata_file) as f:
-                            metadata_dict = json.load(f)
-                            metadata = ModuleMetadata(**metadata_dict)
-                            discovered.append(metadata)
-                            self.module_metadata[metadata.name] = metadata
-                    except Exception as e:
-                        self.module_errors[item.name] = f"Failed to load metadata: {e}"
+                        metadata_dict = _json_loads(metadata_file.read_bytes())
+                        if not _REQUIRED_METADATA_FIELDS <= metadata_dict.keys():
+                            missing = ", ".join(sorted(_REQUIRED_METADATA_FIELDS - metadata_dict.keys()))
+                            raise ValueError(f"missing required fields: {missing}")
+                        metadata = _metadata_from_dict(metadata_dict)
+                    except Exception:
+                        self.module_errors[item.name] = ("Failed to load metadata",) + sys.exc_info()[:2]
+                        continue
+                    self._discovery_cache[cache_key] = (st.st_mtime_ns, st.st_size, metadata_dict)
+                    self._discovery_cache_dirty = True
+                
+                discovered.append(metadata)
+                self.module_metadata[metadata.name] = metadata
+        
+        # Drop cache entries for modules that were removed
+        for stale in [key for key in self._discovery_cache if key not in seen_paths]:
+            del self._discovery_cache[stale]
+            self._discovery_cache_dirty = True
         
         # Check built-in modules
         builtin_dir = Path(__file__).parent.parent / "modules"
@@ -109,12 +243,14 @@ class ModuleLoader:
                             description=f"Built-in {module_name} module",
                             author="Hermetic AI",
                             dependencies=[],
-                            entry_point=f"hermetic_ai_mcp.modules.{module_name}",
+                            entry_point=f"{_BUILTIN_PACKAGE}.{module_name}",
                             enabled=True
                         )
                         discovered.append(metadata)
                         self.module_metadata[module_name] = metadata
         
+        if not self._bulk_depth:
+            self.flush()
         return discovered
     
     def load_module(self, module_name: str, platform: Any = None) -> Optional[ModuleInterface]:
@@ -131,6 +267,155 @@ class ModuleLoader:
         if module_name in self.loaded_modules:
             return self.loaded_modules[module_name]
         
+        try:
+            order = self._topo_order(module_name)
+        except ValueError as e:
+            self.module_errors[module_name] = f"Dependency cycle: {e}"
+            return None
+        
+        # Refuse up front rather than leaving a partially loaded dependency chain behind
+        unavailable = self._check_deps(order[:-1])
+        if unavailable is not None:
+            self.module_errors[module_name] = f"Dependency {unavailable} is not available"
+            return None
+        
+        # Dependencies come first in the order; the requested module is last
+        for name in order:
+            if name in self.loaded_modules:
+                continue
+            if not self._load_one(name, platform):
+                if name != module_name:
+                    self.module_errors[module_name] = f"Dependency {name} failed to load"
+                return None
+        
+        return self.loaded_modules[module_name]
+    
+    def load_modules_parallel(self, module_names: List[str], platform: Any = None,
+                              max_workers: int = 4) -> Dict[str, ModuleInterface]:
+        """
+        Load several modules, running independent loads concurrently
+        
+        Modules (and their dependencies) are grouped into dependency levels;
+        each level is loaded on a thread pool once the previous one finished.
+        
+        Args:
+            module_names: Names of the modules to load
+            platform: Platform instance to pass to modules
+            max_workers: Maximum number of concurrent loads
+            
+        Returns:
+            Requested module names mapped to their loaded instances
+        """
+        # Collect requested modules plus unloaded transitive dependencies
+        pending: Dict[str, List[str]] = {}
+        stack = list(module_names)
+        while stack:
+            name = stack.pop()
+            if name in pending or name in self.loaded_modules:
+                continue
+            metadata = self.module_metadata.get(name)
+            deps = [] if metadata is None else [
+                dep for dep in dict.fromkeys(metadata.dependencies) if dep not in self.loaded_modules
+            ]
+            pending[name] = deps
+            stack.extend(deps)
+        
+        # Kahn-style levels over the dependency edges
+        indegree = {name: len(deps) for name, deps in pending.items()}
+        dependents: Dict[str, List[str]] = defaultdict(list)
+        for name, deps in pending.items():
+            for dep in deps:
+                dependents[dep].append(name)
+        
+        failed = set()
+        
+        def settle(name: str, ok: bool) -> List[str]:
+            """Mark a module finished and return dependents that became ready"""
+            ready = []
+            for dependent in dependents[name]:
+                if not ok and dependent not in failed:
+                    failed.add(dependent)
+                    self.module_errors[dependent] = f"Dependency {name} failed to load"
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
+            return ready
+        
+        level = [name for name, count in indegree.items() if count == 0]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while level:
+                next_level = []
+                futures = {}
+                for name in level:
+                    if name in failed:
+                        next_level.extend(settle(name, False))
+                    else:
+                        futures[executor.submit(self._load_one, name, platform)] = name
+                for future in as_completed(futures):
+                    name = futures[future]
+                    ok = future.result() is not None
+                    if not ok:
+                        failed.add(name)
+                    next_level.extend(settle(name, ok))
+                level = next_level
+        
+        # Anything never reaching indegree 0 sits on a dependency cycle
+        for name, count in indegree.items():
+            if count > 0:
+                self.module_errors[name] = "Dependency cycle detected"
+        
+        return {name: self.loaded_modules[name] for name in module_names if name in self.loaded_modules}
+    
+    def _topo_order(self, module_name: str) -> List[str]:
+        """
+        Compute a dependency-first load order for a module
+        
+        Args:
+            module_name: Name of the module to load
+            
+        Returns:
+            Names not yet loaded, in postorder (module_name last)
+            
+        Raises:
+            ValueError: If the dependency graph contains a cycle
+        """
+        def dependencies_of(name: str) -> List[str]:
+            metadata = self.module_metadata.get(name)
+            return metadata.dependencies if metadata else []
+        
+        order: List[str] = []
+        done = set()
+        path = [module_name]
+        on_path = {module_name}
+        stack = [iter(dependencies_of(module_name))]
+        
+        while stack:
+            dep = next(stack[-1], None)
+            if dep is None:
+                stack.pop()
+                name = path.pop()
+                on_path.discard(name)
+                done.add(name)
+                order.append(name)
+            elif dep in on_path:
+                raise ValueError(" -> ".join(path[path.index(dep):] + [dep]))
+            elif dep not in done and dep not in self.loaded_modules:
+                path.append(dep)
+                on_path.add(dep)
+                stack.append(iter(dependencies_of(dep)))
+        
+        return order
+    
+    def _check_deps(self, names: List[str]) -> Optional[str]:
+        """Return the first dependency that is unregistered or disabled, or None"""
+        for name in names:
+            metadata = self.module_metadata.get(name)
+            if metadata is None or not metadata.enabled:
+                return name
+        return None
+    
+    def _load_one(self, module_name: str, platform: Any = None) -> Optional[ModuleInterface]:
+        """Import, instantiate and initialize a single module whose dependencies are loaded"""
         if module_name not in self.module_metadata:
             self.module_errors[module_name] = "Module not found"
             return None
@@ -141,19 +426,20 @@ class ModuleLoader:
             self.module_errors[module_name] = "Module is disabled"
             return None
         
+        _discovery_state.classes = []
         try:
-            # Check dependencies
-            for dep in metadata.dependencies:
-                if dep not in self.loaded_modules:
-                    # Try to load dependency first
-                    if not self.load_module(dep, platform):
-                        self.module_errors[module_name] = f"Dependency {dep} failed to load"
-                        return None
-            
             # Load the module
-            if metadata.entry_point.startswith("hermetic_ai_mcp.modules"):
-                # Built-in module
-                module = importlib.import_module(metadata.entry_point)
+            if metadata.is_builtin:
+                # Built-in module (a known-bad import is not retried until reload)
+                failure = self._import_failures.get(metadata.entry_point)
+                if failure is not None:
+                    self.module_errors[module_name] = ("Failed to load",) + failure
+                    return None
+                try:
+                    module = _import_entry(metadata.entry_point)
+                except ImportError:
+                    self._import_failures[metadata.entry_point] = sys.exc_info()[:2]
+                    raise
             else:
                 # External module
                 module_path = self.modules_dir / module_name / "__init__.py"
@@ -168,12 +454,27 @@ class ModuleLoader:
                 module = importlib.util.module_from_spec(spec)
                 spec.loader.exec_module(module)
             
-            # Find and instantiate the module class
-            module_class = None
-            for name, obj in inspect.getmembers(module):
-                if inspect.isclass(obj) and issubclass(obj, ModuleInterface) and obj != ModuleInterface:
-                    module_class = obj
-                    break
+            # Prefer a class registered via @hermetic_module during execution
+            module_class = next(
+                (cls for cls in _discovery_state.classes if cls.__module__ == module.__name__), None
+            )
+            
+            # Memoized imports don't re-run decorators, so look for the class marked by
+            # @hermetic_module in the namespace (its own flag, not one inherited from a base)
+            if module_class is None:
+                module_class = next(
+                    (obj for obj in list(module.__dict__.values())
+                     if isinstance(obj, type) and obj.__dict__.get("__hermetic_module__", False)
+                     and obj.__module__ == module.__name__),
+                    None
+                )
+            
+            # Legacy modules: find the ModuleInterface subclass in the namespace
+            if module_class is None:
+                for obj in list(module.__dict__.values()):
+                    if isinstance(obj, type) and obj is not ModuleInterface and issubclass(obj, ModuleInterface):
+                        module_class = obj
+                        break
             
             if not module_class:
                 self.module_errors[module_name] = "No ModuleInterface subclass found"
@@ -187,12 +488,17 @@ class ModuleLoader:
                 self.module_errors[module_name] = "Module initialization failed"
                 return None
             
-            self.loaded_modules[module_name] = instance
+            with self._load_lock:
+                self.loaded_modules[module_name] = instance
+                self._modules_version += 1
+                self.module_errors.pop(module_name, None)
             return instance
             
-        except Exception as e:
-            self.module_errors[module_name] = f"Failed to load: {e}"
+        except Exception:
+            self.module_errors[module_name] = ("Failed to load",) + sys.exc_info()[:2]
             return None
+        finally:
+            _discovery_state.classes = None
     
     def unload_module(self, module_name: str) -> bool:
         """
@@ -211,23 +517,38 @@ class ModuleLoader:
             module = self.loaded_modules[module_name]
             module.shutdown()
             del self.loaded_modules[module_name]
+            self._modules_version += 1
             return True
-        except Exception as e:
-            self.module_errors[module_name] = f"Failed to unload: {e}"
+        except Exception:
+            self.module_errors[module_name] = ("Failed to unload",) + sys.exc_info()[:2]
             return False
     
-    def reload_module(self, module_name: str, platform: Any = None) -> Optional[ModuleInterface]:
+    def reload_module(self, module_name: str, platform: Any = None,
+                      reimport: bool = False) -> Optional[ModuleInterface]:
         """
         Reload a module
         
         Args:
             module_name: Name of the module to reload
             platform: Platform instance to pass to module
+            reimport: Re-execute a built-in module's source (development workflows)
             
         Returns:
             Reloaded module instance or None if failed
         """
         self.unload_module(module_name)
+        
+        metadata = self.module_metadata.get(module_name)
+        if metadata and metadata.is_builtin:
+            self._import_failures.pop(metadata.entry_point, None)
+        if reimport and metadata and metadata.is_builtin:
+            # importlib.reload re-executes in place, so the memoized module object stays valid
+            try:
+                importlib.reload(_import_entry(metadata.entry_point))
+            except Exception:
+                self.module_errors[module_name] = ("Failed to reload",) + sys.exc_info()[:2]
+                return None
+        
         return self.load_module(module_name, platform)
     
     def get_all_tools(self) -> Dict[str, Any]:
@@ -235,11 +556,15 @@ class ModuleLoader:
         Get all tools from loaded modules
         
         Returns:
-            Combined tools dictionary
+            Combined tools dictionary (shared until the next load/unload; do not mutate)
         """
+        if self._tools_cache and self._tools_cache[0] == self._modules_version:
+            return self._tools_cache[1]
+        
         tools = {}
         for module in self.loaded_modules.values():
             tools.update(module.get_tools())
+        self._tools_cache = (self._modules_version, tools)
         return tools
     
     def get_all_commands(self) -> Dict[str, Any]:
@@ -247,11 +572,15 @@ class ModuleLoader:
         Get all commands from loaded modules
         
         Returns:
-            Combined commands dictionary
+            Combined commands dictionary (shared until the next load/unload; do not mutate)
         """
+        if self._commands_cache and self._commands_cache[0] == self._modules_version:
+            return self._commands_cache[1]
+        
         commands = {}
         for module in self.loaded_modules.values():
             commands.update(module.get_commands())
+        self._commands_cache = (self._modules_version, commands)
         return commands
     
     def broadcast_event(self, event: str, data: Any) -> None:
@@ -269,6 +598,14 @@ class ModuleLoader:
                 # Silently ignore event handling errors
                 pass
     
+    @staticmethod
+    def _format_error(error: Union[str, Tuple[str, type, BaseException], None]) -> Optional[str]:
+        """Render a recorded module error for status output"""
+        if error is None or isinstance(error, str):
+            return error
+        context, err_t, err_v = error
+        return f"{context}: {err_t.__name__}: {err_v}"
+    
     def get_status(self) -> Dict[str, Any]:
         """
         Get loader status
@@ -286,7 +623,7 @@ class ModuleLoader:
                     "loaded": name in self.loaded_modules,
                     "enabled": meta.enabled,
                     "version": meta.version,
-                    "error": self.module_errors.get(name)
+                    "error": self._format_error(self.module_errors.get(name))
                 }
                 for name, meta in self.module_metadata.items()
             }
@@ -4,16 +4,30 @@ Universal MCP with auto-project detection and modular architecture
 """
 import os
 import json
+import time
+import atexit
+import weakref
 import hashlib
+import secrets
+import functools
 import asyncio
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime
 from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+from .memory_system import DualLayerMemorySystem, MemoryScope, MemoryType
 from .sequential_thinking import SequentialThinkingEngine
-from .lsp_integration import LSPClient, CodeIntelligence, Language
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from .lsp_integration import LSPClient, CodeIntelligence
 
 # Disable logging for MCP compatibility
 if not os.environ.get('DEBUG_MCP'):
@@ -21,7 +35,69 @@ if not os.environ.get('DEBUG_MCP'):
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _dump_json(data: Any, indent: bool = True) -> bytes:
+    """Serialize to JSON bytes (indented unless indent=False), via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None, default=str)
+    if indent:
+        return json.dumps(data, indent=2, default=str).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def _load_json(raw: bytes) -> Any:
+    """Parse JSON bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=256)
+def _path_hash(abs_path: str) -> str:
+    """Stable project identity; keys the registry and on-disk project dirs, so keep SHA-256"""
+    return hashlib.sha256(abs_path.encode()).hexdigest()[:16]
+
+
+# Parsed registry files by path: (st_mtime_ns, st_size, registry)
+_REGISTRY_CACHE: Dict[str, Tuple[int, int, Dict[str, Dict]]] = {}
+
+
+# Live detectors with possibly unsaved registry changes; held weakly so
+# registering for the exit flush doesn't keep a detector alive
+_LIVE_DETECTORS: "weakref.WeakSet[ProjectDetector]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_detectors():
+    """Write deferred registry updates of every live detector at exit"""
+    for detector in list(_LIVE_DETECTORS):
+        detector.flush()
+
+
+def _copy_registry(registry: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Copy a registry deep enough that per-project edits don't leak"""
+    return {hash_id: dict(info) for hash_id, info in registry.items()}
+
+
+def _flatten_indicators(indicators: Dict[str, List[str]]) -> Tuple[Dict[str, str], List[Tuple[str, str]], Tuple[str, ...]]:
+    """
+    Split project indicators into exact filenames and '*<suffix>' patterns
+    
+    Returns:
+        (filename -> type, [(suffix, type)], all suffixes as one tuple for
+        a single str.endswith prefilter)
+    """
+    exact: Dict[str, str] = {}
+    suffixes: List[Tuple[str, str]] = []
+    for lang, patterns in indicators.items():
+        for pattern in patterns:
+            if pattern.startswith('*'):
+                suffixes.append((pattern[1:], lang))
+            else:
+                exact.setdefault(pattern, lang)
+    return exact, suffixes, tuple(suffix for suffix, _ in suffixes)
+
+
+@dataclass(slots=True)
 class ProjectContext:
     """Represents a detected project and its context"""
     project_hash: str
@@ -58,6 +134,23 @@ class ProjectDetector:
         'elixir': ['mix.exs']
     }
     
+    # Flattened PROJECT_INDICATORS for a single directory listing
+    EXACT_INDICATORS, SUFFIX_INDICATORS, SUFFIXES = _flatten_indicators(PROJECT_INDICATORS)
+    
+    # Seconds a last_accessed-only change may stay unsaved
+    REGISTRY_FLUSH_INTERVAL = 5.0
+    
+    # Directories detect_workspace never descends into (dot-dirs are skipped too)
+    WORKSPACE_SKIP_DIRS = frozenset({
+        'node_modules', '__pycache__', 'venv', 'env', 'target', 'build', 'dist', 'vendor'
+    })
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Keep the lookup tables in sync with overridden indicators
+        if 'PROJECT_INDICATORS' in cls.__dict__:
+            cls.EXACT_INDICATORS, cls.SUFFIX_INDICATORS, cls.SUFFIXES = _flatten_indicators(cls.PROJECT_INDICATORS)
+    
     def __init__(self, base_dir: str = None):
         """
         Initialize project detector
@@ -70,23 +163,82 @@ class ProjectDetector:
         self.projects_dir.mkdir(parents=True, exist_ok=True)
         
         self.project_registry = self._load_registry()
+        # Parsed (created, last_accessed) per project hash; never persisted
+        self._dt_cache: Dict[str, Tuple[datetime, datetime]] = {}
+        self._path_index: Dict[str, str] = {}
+        self._by_basename: Dict[str, List[str]] = {}
+        for hash_id, info in self.project_registry.items():
+            self._index_project(hash_id, info['path'])
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        _LIVE_DETECTORS.add(self)
     
     def _load_registry(self) -> Dict[str, Dict]:
         """Load the project registry from disk"""
         registry_file = self.base_dir / "project_registry.json"
-        if registry_file.exists():
-            try:
-                with open(registry_file, 'r') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+        try:
+            st = registry_file.stat()
+        except OSError:
+            return {}
+        
+        # Skip the parse when the file is unchanged since we last read or wrote it
+        key = str(registry_file)
+        cached = _REGISTRY_CACHE.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return _copy_registry(cached[2])
+        
+        try:
+            registry = _load_json(registry_file.read_bytes())
+        except:
+            return {}
+        _REGISTRY_CACHE[key] = (st.st_mtime_ns, st.st_size, _copy_registry(registry))
+        return registry
     
     def _save_registry(self):
-        """Save the project registry to disk"""
+        """Save the project registry to disk (atomic replace)"""
         registry_file = self.base_dir / "project_registry.json"
-        with open(registry_file, 'w') as f:
-            json.dump(self.project_registry, f, indent=2, default=str)
+        tmp_file = registry_file.with_name(registry_file.name + ".tmp")
+        tmp_file.write_bytes(_dump_json(self.project_registry))
+        os.replace(tmp_file, registry_file)
+        st = registry_file.stat()
+        _REGISTRY_CACHE[str(registry_file)] = (
+            st.st_mtime_ns, st.st_size, _copy_registry(self.project_registry)
+        )
+        self._dirty = False
+        self._last_flush = time.monotonic()
+    
+    def flush(self):
+        """Write pending registry changes, if any"""
+        if self._dirty:
+            self._save_registry()
+    
+    def _index_project(self, hash_id: str, path: str):
+        """Add a project to the path and basename lookup indexes"""
+        self._path_index[path] = hash_id
+        basename = os.path.basename(path.rstrip(os.sep))
+        self._by_basename.setdefault(basename, []).append(hash_id)
+    
+    def _project_times(self, hash_id: str, info: Dict) -> Tuple[datetime, datetime]:
+        """Return the parsed (created, last_accessed) datetimes for a project"""
+        times = self._dt_cache.get(hash_id)
+        if times is None:
+            times = (datetime.fromisoformat(info['created']),
+                     datetime.fromisoformat(info['last_accessed']))
+            self._dt_cache[hash_id] = times
+        return times
+    
+    def _context_from_info(self, hash_id: str, info: Dict) -> ProjectContext:
+        """Build a ProjectContext for an existing registry entry"""
+        created, accessed = self._project_times(hash_id, info)
+        return ProjectContext(
+            project_hash=hash_id,
+            project_path=info['path'],
+            project_type=info['type'],
+            created_at=created,
+            last_accessed=accessed,
+            config=info.get('config', {}),
+            is_new=False
+        )
     
     def generate_project_hash(self, project_path: str) -> str:
         """
@@ -99,8 +251,7 @@ class ProjectDetector:
             Unique project hash
         """
         # Use absolute path for consistent hashing
-        abs_path = os.path.abspath(project_path)
-        return hashlib.sha256(abs_path.encode()).hexdigest()[:16]
+        return _path_hash(os.path.abspath(project_path))
     
     def detect_project_type(self, project_path: str) -> str:
         """
@@ -112,32 +263,105 @@ class ProjectDetector:
         Returns:
             Project type (python, javascript, mixed, etc.)
         """
-        path = Path(project_path)
-        detected_types = []
-        
-        for lang, indicators in self.PROJECT_INDICATORS.items():
-            for indicator in indicators:
-                if "*" in indicator:
-                    # Handle glob patterns
-                    if list(path.glob(indicator)):
-                        detected_types.append(lang)
-                        break
-                else:
-                    # Check for specific file
-                    if (path / indicator).exists():
-                        detected_types.append(lang)
-                        break
+        detected_types = set()
+        all_types = len(self.PROJECT_INDICATORS)
+        
+        # One directory listing instead of a stat/glob per indicator
+        try:
+            with os.scandir(project_path) as entries:
+                for entry in entries:
+                    lang = self._match_indicator(entry.name)
+                    if lang is not None:
+                        detected_types.add(lang)
+                        if len(detected_types) == all_types:
+                            break
+        except OSError:
+            return "unknown"
         
+        return self._classify(detected_types)
+    
+    def _match_indicator(self, name: str) -> Optional[str]:
+        """Return the project type a file name indicates, if any"""
+        lang = self.EXACT_INDICATORS.get(name)
+        # One C-level endswith over every suffix rejects most names outright
+        if lang is None and self.SUFFIXES and name.endswith(self.SUFFIXES):
+            for suffix, suffix_lang in self.SUFFIX_INDICATORS:
+                if name.endswith(suffix):
+                    return suffix_lang
+        return lang
+    
+    @staticmethod
+    def _classify(detected_types: set) -> str:
+        """Collapse the detected indicator types into a single project type"""
         if not detected_types:
             return "unknown"
         elif len(detected_types) == 1:
-            return detected_types[0]
+            return next(iter(detected_types))
         else:
             # Multiple types detected
             if 'typescript' in detected_types and 'javascript' in detected_types:
                 return 'typescript'  # TypeScript is superset
             return "mixed"
     
+    def _scan_workspace_dir(self, path: str) -> Tuple[str, List[str]]:
+        """List a directory once, returning its project type and subdirectories to visit"""
+        detected_types = set()
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if not name.startswith('.') and name not in self.WORKSPACE_SKIP_DIRS:
+                            subdirs.append(entry.path)
+                    else:
+                        lang = self._match_indicator(name)
+                        if lang is not None:
+                            detected_types.add(lang)
+        except OSError:
+            return "unknown", []
+        return self._classify(detected_types), subdirs
+    
+    def detect_workspace(self, root: str, max_depth: int = 3,
+                         max_workers: int = 8) -> Dict[str, str]:
+        """
+        Find project roots under a (possibly multi-root) workspace
+        
+        Each directory level is listed in parallel; the listings are I/O
+        bound, so threads overlap the filesystem latency.
+        
+        Args:
+            root: Workspace root directory
+            max_depth: How many directory levels below root to search
+            max_workers: Thread pool size
+            
+        Returns:
+            Mapping of directory path to detected project type, for every
+            directory that has project indicators
+        """
+        found: Dict[str, str] = {}
+        frontier = [os.path.abspath(root)]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for depth in range(max_depth + 1):
+                if not frontier:
+                    break
+                next_frontier = []
+                for path, (project_type, subdirs) in zip(
+                    frontier, executor.map(self._scan_workspace_dir, frontier)
+                ):
+                    if project_type != "unknown":
+                        found[path] = project_type
+                    if depth < max_depth:
+                        next_frontier.extend(subdirs)
+                frontier = next_frontier
+        
+        return found
+    
     def detect_project(self, cwd: str) -> ProjectContext:
         """
         Detect and load/create project context
@@ -155,16 +379,21 @@ class ProjectDetector:
             # Load existing project
             project_info = self.project_registry[project_hash]
             
-            # Update last accessed time
-            project_info['last_accessed'] = datetime.now()
-            self._save_registry()
+            # Update last accessed time; timestamp-only changes are written behind
+            now = datetime.now()
+            created, _ = self._project_times(project_hash, project_info)
+            project_info['last_accessed'] = now.isoformat()
+            self._dt_cache[project_hash] = (created, now)
+            self._dirty = True
+            if time.monotonic() - self._last_flush > self.REGISTRY_FLUSH_INTERVAL:
+                self._save_registry()
             
             return ProjectContext(
                 project_hash=project_hash,
                 project_path=cwd,
                 project_type=project_info['type'],
-                created_at=datetime.fromisoformat(project_info['created']),
-                last_accessed=project_info['last_accessed'],
+                created_at=created,
+                last_accessed=now,
                 config=project_info.get('config', {}),
                 is_new=False
             )
@@ -194,6 +423,8 @@ class ProjectDetector:
                 'last_accessed': now.isoformat(),
                 'config': {}
             }
+            self._dt_cache[project_hash] = (now, now)
+            self._index_project(project_hash, cwd)
             self._save_registry()
             
             return project_context
@@ -201,30 +432,24 @@ class ProjectDetector:
     def get_project_by_name(self, name: str) -> Optional[ProjectContext]:
         """Get project by name or hash"""
         # First check if it's a hash
-        if name in self.project_registry:
-            info = self.project_registry[name]
-            return ProjectContext(
-                project_hash=name,
-                project_path=info['path'],
-                project_type=info['type'],
-                created_at=datetime.fromisoformat(info['created']),
-                last_accessed=datetime.fromisoformat(info['last_accessed']),
-                config=info.get('config', {}),
-                is_new=False
-            )
+        info = self.project_registry.get(name)
+        if info is not None:
+            return self._context_from_info(name, info)
+        
+        # Then an exact project path
+        hash_id = self._path_index.get(name)
+        if hash_id is not None:
+            return self._context_from_info(hash_id, self.project_registry[hash_id])
         
-        # Check if it's a path
+        # Then a project directory name
+        hashes = self._by_basename.get(name)
+        if hashes:
+            return self._context_from_info(hashes[0], self.project_registry[hashes[0]])
+        
+        # Only genuinely partial names need the full scan
         for hash_id, info in self.project_registry.items():
-            if info['path'].endswith(name) or name in info['path']:
-                return ProjectContext(
-                    project_hash=hash_id,
-                    project_path=info['path'],
-                    project_type=info['type'],
-                    created_at=datetime.fromisoformat(info['created']),
-                    last_accessed=datetime.fromisoformat(info['last_accessed']),
-                    config=info.get('config', {}),
-                    is_new=False
-                )
+            if name in info['path']:
+                return self._context_from_info(hash_id, info)
         
         return None
 
@@ -251,11 +476,11 @@ class HermeticAIPlatform:
         self.project_detector = ProjectDetector(str(self.base_dir))
         self.current_project: Optional[ProjectContext] = None
         # Initialize memory system with base directory
-        from .memory_system import DualLayerMemorySystem
         self.memory_system = DualLayerMemorySystem(str(self.base_dir / "memory"))
         self.sequential_thinking = SequentialThinkingEngine()
-        self.lsp_client: Optional[LSPClient] = None
-        self.code_intelligence: Optional[CodeIntelligence] = None
+        self.lsp_client: Optional["LSPClient"] = None
+        self.code_intelligence: Optional["CodeIntelligence"] = None
+        self.verification_engine = None  # Created on first verify_code call
         
         # Module registry
         self.modules: Dict[str, Any] = {}
@@ -277,10 +502,8 @@ class HermeticAIPlatform:
         Returns:
             Session ID
         """
-        # Generate session ID
-        self.session_id = hashlib.sha256(
-            f"{datetime.now().isoformat()}_{cwd}".encode()
-        ).hexdigest()[:16]
+        # Generate session ID (random, not derived from time/path)
+        self.session_id = secrets.token_hex(8)
         self.session_start = datetime.now()
         
         pass  # Session started
@@ -295,9 +518,16 @@ class HermeticAIPlatform:
             else:
                 pass  # Existing project loaded
             
-            # Initialize LSP for the project
-            self.lsp_client = LSPClient(self.current_project.project_path)
-            self.code_intelligence = CodeIntelligence(self.lsp_client)
+            # Initialize LSP for the project (imported on first use); code
+            # intelligence is optional, so a broken LSP stack must not stop
+            # the session from starting
+            try:
+                from .lsp_integration import LSPClient, CodeIntelligence
+            except ImportError:
+                logger.warning("LSP integration unavailable; continuing without code intelligence")
+            else:
+                self.lsp_client = LSPClient(self.current_project.project_path)
+                self.code_intelligence = CodeIntelligence(self.lsp_client)
             
             # Load project memory
             self._load_project_memory()
@@ -311,15 +541,15 @@ class HermeticAIPlatform:
         
         # Initialize memory system if not already done
         if not self.memory_system:
-            from .memory_system import DualLayerMemory
-            self.memory_system = DualLayerMemory(str(self.base_dir))
+            self.memory_system = DualLayerMemorySystem(str(self.base_dir / "memory"))
+        
+        # Write pending thoughts to the project they were recorded under
+        if self.sequential_thinking and self.sequential_thinking.memory_system:
+            self.sequential_thinking.flush_memory()
         
         # Set the project in memory system
         self.memory_system.set_project(self.current_project.project_hash)
         
-        # Import MemoryScope locally
-        from .memory_system import MemoryScope
-        
         # Load recent memories for context
         recent_memories = self.memory_system.search(
             query="*",  # Get all recent memories
@@ -374,7 +604,7 @@ class HermeticAIPlatform:
     async def _verify_code(self, code: str, file_path: str = None, language: str = "python") -> Dict[str, Any]:
         """Verify code using Hermetic verification engine"""
         # Initialize verification engine if needed
-        if not hasattr(self, 'verification_engine'):
+        if self.verification_engine is None:
             from .verification_engine import CodeVerifier
             self.verification_engine = CodeVerifier(
                 memory_system=self.memory_system,
@@ -390,7 +620,6 @@ class HermeticAIPlatform:
         
         # Store verification result in memory if available
         if self.memory_system and result:
-            from .memory_system import MemoryType, MemoryScope
             self.memory_system.store(
                 content=f"Verification result: {result['passed']}",
                 memory_type=MemoryType.VERIFICATION,
@@ -464,6 +693,13 @@ class HermeticAIPlatform:
         if self.lsp_client:
             await self.lsp_client.shutdown()
         
+        # Persist deferred project registry updates
+        self.project_detector.flush()
+        
+        # Write buffered thoughts to memory
+        if self.sequential_thinking.memory_system:
+            self.sequential_thinking.flush_memory()
+        
         # Save session data
         if self.session_id:
             session_data = {
@@ -477,7 +713,6 @@ class HermeticAIPlatform:
             # Save to session history
             session_file = self.base_dir / "sessions" / f"{self.session_id}.json"
             session_file.parent.mkdir(exist_ok=True)
-            with open(session_file, 'w') as f:
-                json.dump(session_data, f, indent=2)
+            session_file.write_bytes(_dump_json(session_data, indent=False))
         
         pass  # Shutdown complete
\ No newline at end of file
@@ -3,12 +3,21 @@ Sequential Thinking Module - Reimplemented for Hermetic AI Platform
 Based on the core logic from Sequential Thinking MCP, integrated natively
 """
 import json
+import re
 import time
+import logging
+from collections import Counter, deque
+from operator import attrgetter, itemgetter
 from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
+# Memory types, imported on first use to avoid a circular dependency
+MemoryType = MemoryScope = None
+
 
 class ThoughtType(Enum):
     """Types of thoughts in the sequential thinking process"""
@@ -19,7 +28,21 @@ class ThoughtType(Enum):
     VERIFICATION = "verification"
 
 
-@dataclass
+# Plain dict lookup instead of the Enum.value descriptor on hot paths
+_TT_VALUE = {t: t.value for t in ThoughtType}
+
+# "<prev>_to_<cur>" pattern names for every thought-type transition
+_TRANSITION_NAMES = {
+    (a, b): f"{a.value}_to_{b.value}" for a in ThoughtType for b in ThoughtType
+}
+_TRANSITION_BY_NAME = {name: pair for pair, name in _TRANSITION_NAMES.items()}
+
+# Single case-insensitive scan for the keywords that mark a thought's type
+_TYPE_RE = re.compile(r'hypothesis|verif', re.IGNORECASE)
+_HYPOTHESIS_RE = re.compile(r'hypothesis', re.IGNORECASE)
+
+
+@dataclass(slots=True)
 class ThoughtData:
     """Represents a single thought in the thinking sequence"""
     thought: str
@@ -44,10 +67,40 @@ class ThoughtData:
             self.thought_type = ThoughtType.REVISION
         elif self.branch_from_thought:
             self.thought_type = ThoughtType.BRANCH
-        elif "hypothesis" in self.thought.lower():
-            self.thought_type = ThoughtType.HYPOTHESIS
-        elif "verif" in self.thought.lower():
-            self.thought_type = ThoughtType.VERIFICATION
+        else:
+            m = _TYPE_RE.search(self.thought)
+            if m:
+                # "hypothesis" wins over "verif" wherever it appears
+                if m.group()[0] in 'hH' or _HYPOTHESIS_RE.search(self.thought, m.end()):
+                    self.thought_type = ThoughtType.HYPOTHESIS
+                else:
+                    self.thought_type = ThoughtType.VERIFICATION
+
+
+_THOUGHT_FIELDS = tuple(f.name for f in fields(ThoughtData))
+_get_thought_fields = attrgetter(*_THOUGHT_FIELDS)
+_get_dict_fields = itemgetter(*_THOUGHT_FIELDS)
+_TT_BY_VALUE = {value: t for t, value in _TT_VALUE.items()}
+_TT_INDEX = _THOUGHT_FIELDS.index('thought_type')
+
+
+def _to_dict(thought: ThoughtData) -> Dict[str, Any]:
+    """Convert ThoughtData to a serializable dict (all fields are flat)"""
+    data = dict(zip(_THOUGHT_FIELDS, _get_thought_fields(thought)))
+    data['thought_type'] = _TT_VALUE[thought.thought_type]
+    return data
+
+
+def _from_dict(data: Dict[str, Any]) -> ThoughtData:
+    """Rebuild ThoughtData from a _to_dict() record"""
+    try:
+        # Complete records (everything export_session writes) go positionally
+        values = list(_get_dict_fields(data))
+        values[_TT_INDEX] = _TT_BY_VALUE[values[_TT_INDEX]]
+        return ThoughtData(*values)
+    except (KeyError, TypeError):
+        # Partial or hand-written records fall back to defaults and re-detection
+        return ThoughtData(**{k: v for k, v in data.items() if k != 'thought_type'})
 
 
 class SequentialThinkingEngine:
@@ -56,6 +109,14 @@ class SequentialThinkingEngine:
     Reimplemented from TypeScript to Python with enhancements
     """
     
+    # Buffered thoughts are written to memory in batches of this size, or once
+    # this many seconds have passed since the last flush
+    MEMORY_FLUSH_SIZE = 16
+    MEMORY_FLUSH_INTERVAL = 5.0
+    
+    # Thoughts kept while the memory system keeps failing; the oldest are dropped past this
+    MEMORY_BUFFER_LIMIT = 256
+    
     def __init__(self, memory_system=None):
         """
         Initialize the sequential thinking engine
@@ -69,6 +130,13 @@ class SequentialThinkingEngine:
         self.memory_system = memory_system
         self.thought_patterns = {}
         self.hypothesis_stack = []
+        self._mem_buffer: deque = deque(maxlen=self.MEMORY_BUFFER_LIMIT)
+        self._last_mem_flush = time.monotonic()
+        # Running tallies kept in step with thought_history
+        self._type_counts: Counter = Counter()
+        self._revision_count = 0
+        # Thought-flow transitions keyed by (prev_type, cur_type)
+        self._transitions: Counter = Counter()
         
     def validate_thought_input(self, data: Dict[str, Any]) -> ThoughtData:
         """
@@ -128,6 +196,9 @@ class SequentialThinkingEngine:
             
             # Add to history
             self.thought_history.append(thought_data)
+            self._type_counts[thought_data.thought_type] += 1
+            if thought_data.is_revision:
+                self._revision_count += 1
             
             # Handle branching
             if thought_data.branch_from_thought and thought_data.branch_id:
@@ -156,7 +227,7 @@ class SequentialThinkingEngine:
                 'thoughtNumber': thought_data.thought_number,
                 'totalThoughts': thought_data.total_thoughts,
                 'nextThoughtNeeded': thought_data.next_thought_needed,
-                'thoughtType': thought_data.thought_type.value,
+                'thoughtType': _TT_VALUE[thought_data.thought_type],
                 'branches': list(self.branches.keys()),
                 'currentBranch': self.current_branch,
                 'thoughtHistoryLength': len(self.thought_history),
@@ -182,59 +253,85 @@ class SequentialThinkingEngine:
                 'reason': thought.thought[:100]
             }
         
-        # Track thought flow patterns
+        # Track thought flow patterns; names are only built on export
         if len(self.thought_history) > 1:
-            prev_thought = self.thought_history[-2]
-            transition = f"{prev_thought.thought_type.value}_to_{thought.thought_type.value}"
-            if transition not in self.thought_patterns:
-                self.thought_patterns[transition] = 0
-            self.thought_patterns[transition] += 1
+            self._transitions[(self.thought_history[-2].thought_type, thought.thought_type)] += 1
+    
+    def get_patterns(self) -> Dict[str, Any]:
+        """Get detected patterns, with transitions as "<prev>_to_<cur>" counts"""
+        patterns = dict(self.thought_patterns)
+        for pair, count in self._transitions.items():
+            patterns[_TRANSITION_NAMES[pair]] = count
+        return patterns
     
     def _store_in_memory(self, thought: ThoughtData):
-        """Store thought in memory system for future reference"""
+        """Queue thought for storage in the memory system"""
         if not self.memory_system:
             return
             
-        # Import memory types locally to avoid circular dependency
+        global MemoryType, MemoryScope
         try:
-            from .memory_system import MemoryType, MemoryScope
+            if MemoryType is None:
+                from .memory_system import MemoryType, MemoryScope
             
-            # Store the thought in project-specific memory
-            self.memory_system.store(
-                content=thought.thought,
-                memory_type=MemoryType.THOUGHT,
-                scope=MemoryScope.PROJECT,
-                metadata={
+            # Buffer the thought for project-specific memory
+            self._mem_buffer.append((
+                thought.thought,
+                MemoryType.THOUGHT,
+                MemoryScope.PROJECT,
+                {
                     'thought_number': thought.thought_number,
                     'total_thoughts': thought.total_thoughts,
-                    'thought_type': thought.thought_type.value,
+                    'thought_type': _TT_VALUE[thought.thought_type],
                     'timestamp': thought.timestamp,
                     'branch_id': thought.branch_id,
                     'confidence_score': thought.confidence_score,
                     'is_revision': thought.is_revision,
                     'revises_thought': thought.revises_thought
                 }
-            )
+            ))
+            if (len(self._mem_buffer) >= self.MEMORY_FLUSH_SIZE
+                    or time.monotonic() - self._last_mem_flush > self.MEMORY_FLUSH_INTERVAL):
+                self.flush_memory()
         except ImportError:
             # If memory system is not available, log but don't fail
-            import logging
-            logging.warning("Memory system not available for thought storage")
+            logger.warning("Memory system not available for thought storage")
+    
+    def flush_memory(self):
+        """Write buffered thoughts to the memory system in one batch"""
+        if not self._mem_buffer or not self.memory_system:
+            return
+        
+        self._last_mem_flush = time.monotonic()
+        batch = list(self._mem_buffer)
+        try:
+            self.memory_system.store_many(batch)
+        except Exception as e:
+            # Keep the batch for the next flush (the buffer is bounded), but
+            # don't fail the thought or export that triggered this one
+            logger.warning(f"Failed to store {len(batch)} buffered thoughts: {e}")
+            return
+        # Drop only what was stored
+        for _ in range(len(batch)):
+            self._mem_buffer.popleft()
     
     def get_thought_summary(self) -> Dict[str, Any]:
         """Get a summary of the thinking process"""
         if not self.thought_history:
             return {'status': 'no_thoughts'}
         
+        type_counts = self._type_counts
+        
         return {
             'total_thoughts': len(self.thought_history),
             'branches_created': len(self.branches),
-            'revisions_made': sum(1 for t in self.thought_history if t.is_revision),
+            'revisions_made': self._revision_count,
             'hypotheses_generated': len(self.hypothesis_stack),
             'thought_types': {
-                t_type.value: sum(1 for t in self.thought_history if t.thought_type == t_type)
-                for t_type in ThoughtType
+                value: type_counts[t_type]
+                for t_type, value in _TT_VALUE.items()
             },
-            'patterns_detected': len(self.thought_patterns),
+            'patterns_detected': len(self.thought_patterns) + len(self._transitions),
             'completion_status': not self.thought_history[-1].next_thought_needed if self.thought_history else False
         }
     
@@ -246,7 +343,7 @@ class SequentialThinkingEngine:
                 'branch_id': branch_id,
                 'thought_count': len(branch_thoughts),
                 'origin_thought': branch_thoughts[0].branch_from_thought if branch_thoughts else None,
-                'thoughts': [asdict(t) for t in branch_thoughts]
+                'thoughts': [_to_dict(t) for t in branch_thoughts]
             }
         
         # Analyze all branches
@@ -268,25 +365,22 @@ class SequentialThinkingEngine:
         self.current_branch = None
         self.hypothesis_stack.clear()
         self.thought_patterns.clear()
+        self._type_counts.clear()
+        self._revision_count = 0
+        self._transitions.clear()
     
     def export_session(self) -> Dict[str, Any]:
         """Export the entire thinking session for analysis or replay"""
-        def serialize_thought(thought):
-            """Convert ThoughtData to serializable dict"""
-            data = asdict(thought)
-            # Convert enum to string
-            if 'thought_type' in data and hasattr(data['thought_type'], 'value'):
-                data['thought_type'] = data['thought_type'].value
-            return data
+        self.flush_memory()
         
         return {
             'timestamp': datetime.now().isoformat(),
-            'thoughts': [serialize_thought(t) for t in self.thought_history],
+            'thoughts': [_to_dict(t) for t in self.thought_history],
             'branches': {
-                bid: [serialize_thought(t) for t in thoughts]
+                bid: [_to_dict(t) for t in thoughts]
                 for bid, thoughts in self.branches.items()
             },
-            'patterns': self.thought_patterns,
+            'patterns': self.get_patterns(),
             'summary': self.get_thought_summary()
         }
     
@@ -295,15 +389,17 @@ class SequentialThinkingEngine:
         self.reset()
         
         # Reconstruct thoughts
-        for thought_dict in session_data.get('thoughts', []):
-            thought = ThoughtData(**{k: v for k, v in thought_dict.items() if k != 'thought_type'})
-            self.thought_history.append(thought)
+        self.thought_history.extend(map(_from_dict, session_data.get('thoughts', [])))
+        self._type_counts.update(map(attrgetter('thought_type'), self.thought_history))
+        self._revision_count = sum(map(attrgetter('is_revision'), self.thought_history))
         
         # Reconstruct branches
         for bid, branch_thoughts in session_data.get('branches', {}).items():
-            self.branches[bid] = [
-                ThoughtData(**{k: v for k, v in t.items() if k != 'thought_type'})
-                for t in branch_thoughts
-            ]
+            self.branches[bid] = list(map(_from_dict, branch_thoughts))
         
-        self.thought_patterns = session_data.get('patterns', {})
\ No newline at end of file
+        for name, value in session_data.get('patterns', {}).items():
+            pair = _TRANSITION_BY_NAME.get(name)
+            if pair is not None and isinstance(value, int):
+                self._transitions[pair] = value
+            else:
+                self.thought_patterns[name] = value
\ No newline at end of file
@@ -4,20 +4,214 @@ Based on Hermetic Consciousness verification with enhancements
 """
 import ast
 import re
+import os
 import subprocess
-import tempfile
 import hashlib
 import multiprocessing
 import resource
 import contextlib
 import io
+import sys
+import atexit
+import traceback
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Dict, Any, Tuple, List, Optional
-from pathlib import Path
 from datetime import datetime
 import logging
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
+# Verification results shared by every CodeVerifier in the process (LRU)
+_VERIFY_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_VERIFY_CACHE_LOCK = threading.Lock()
+_VERIFY_CACHE_SIZE = 1024
+
+# String-literal strippers, applied in this order (order affects the result)
+_DQ_STRING_RE = re.compile(r'"[^"]*"')
+_SQ_STRING_RE = re.compile(r"'[^']*'")
+_TDQ_STRING_RE = re.compile(r'""".*?"""', re.DOTALL)
+_TSQ_STRING_RE = re.compile(r"'''.*?'''", re.DOTALL)
+
+# Reusable sandbox worker processes for strict_isolation=False
+_SANDBOX_POOL = None
+_SANDBOX_POOL_LOCK = threading.Lock()
+_SANDBOX_POOL_SIZE = 2
+_SANDBOX_TASKS_PER_WORKER = 50
+# Per-worker caps set by the pool initializer (address space, written file size)
+_SANDBOX_MEMORY_LIMIT = 512 * 1024 * 1024
+_SANDBOX_FILE_SIZE_LIMIT = 16 * 1024 * 1024
+# How often a waiting caller checks whether its pool was replaced
+_SANDBOX_POLL_INTERVAL = 0.1
+
+# Per-process state of verify_many workers
+_WORKER_CONFIG: Optional[Tuple[type, bool, bool]] = None
+_WORKER_VERIFIER = None
+
+
+def _run_code(code: str) -> Dict[str, Any]:
+    """Execute code as __main__ inside a sandbox pool worker"""
+    stdout, stderr = io.StringIO(), io.StringIO()
+    success = False
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            exec(compile(code, '<sandbox>', 'exec'), {'__name__': '__main__'})
+            success = True
+        except SystemExit as e:
+            # Mirror the interpreter: None/0 succeed, other values fail
+            if e.code is None or e.code == 0:
+                success = True
+            elif not isinstance(e.code, int):
+                print(e.code, file=sys.stderr)
+        except BaseException:
+            traceback.print_exc()
+    return {'success': success, 'output': stdout.getvalue(), 'error': stderr.getvalue()}
+
+
+def _limit_sandbox_worker():
+    """Pool initializer: cap a sandbox worker's memory and written file sizes"""
+    for limit, value in ((resource.RLIMIT_AS, _SANDBOX_MEMORY_LIMIT),
+                         (resource.RLIMIT_FSIZE, _SANDBOX_FILE_SIZE_LIMIT)):
+        try:
+            _, hard = resource.getrlimit(limit)
+            if hard != resource.RLIM_INFINITY:
+                value = min(value, hard)
+            # Hard limit too, so executed code can't raise it back
+            resource.setrlimit(limit, (value, value))
+        except (ValueError, OSError):
+            pass
+
+
+def _get_sandbox_pool():
+    """Return the shared sandbox pool, starting it on first use"""
+    global _SANDBOX_POOL
+    with _SANDBOX_POOL_LOCK:
+        if _SANDBOX_POOL is None:
+            # spawn: never fork a possibly multi-threaded server process
+            _SANDBOX_POOL = multiprocessing.get_context('spawn').Pool(
+                processes=_SANDBOX_POOL_SIZE,
+                initializer=_limit_sandbox_worker,
+                maxtasksperchild=_SANDBOX_TASKS_PER_WORKER
+            )
+        return _SANDBOX_POOL
+
+
+def _reset_sandbox_pool(pool=None):
+    """
+    Terminate the shared sandbox pool (e.g. when a worker is stuck)
+    
+    Args:
+        pool: Only terminate if this is still the shared pool, so a caller
+            that timed out can't kill a pool another caller already rebuilt
+            (None: terminate whatever pool is current)
+    """
+    global _SANDBOX_POOL
+    with _SANDBOX_POOL_LOCK:
+        if _SANDBOX_POOL is not None and (pool is None or _SANDBOX_POOL is pool):
+            _SANDBOX_POOL.terminate()
+            _SANDBOX_POOL = None
+
+
+def _sandbox_pool_replaced(pool) -> bool:
+    """Whether pool is no longer the shared sandbox pool"""
+    with _SANDBOX_POOL_LOCK:
+        return _SANDBOX_POOL is not pool
+
+
+atexit.register(_reset_sandbox_pool)
+
+
+def _init_worker(verifier_cls: type, strict_mode: bool, strict_isolation: bool):
+    """Remember which verifier a verify_many worker process should use"""
+    global _WORKER_CONFIG, _WORKER_VERIFIER
+    _WORKER_CONFIG = (verifier_cls, strict_mode, strict_isolation)
+    _WORKER_VERIFIER = None
+
+
+def _verify_one(item: Tuple[str, Optional[str], str, Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Verify one (code, file_path, language, exec_result) item in a worker"""
+    global _WORKER_VERIFIER
+    if _WORKER_VERIFIER is None:
+        verifier_cls, strict_mode, strict_isolation = _WORKER_CONFIG
+        _WORKER_VERIFIER = verifier_cls(strict_mode=strict_mode, strict_isolation=strict_isolation)
+    code, file_path, language, exec_result = item
+    return _WORKER_VERIFIER._verify_code_with_tree(code, None, file_path, language, True, exec_result)
+
+
+@lru_cache(maxsize=4096)
+def _mkmsg(pattern: str, line: int) -> str:
+    """Build (once) the interned violation message for a pattern hit on a line"""
+    return sys.intern(f"Forbidden pattern '{pattern}' found at line {line}")
+
+
+def _cache_get(cache_key: tuple) -> Optional[Dict[str, Any]]:
+    """Look up a cached verification result, marking it recently used"""
+    with _VERIFY_CACHE_LOCK:
+        cached = _VERIFY_CACHE.get(cache_key)
+        if cached is not None:
+            _VERIFY_CACHE.move_to_end(cache_key)
+    return cached
+
+
+def _compile_regex(regex: str, flags: int = 0):
+    """
+    Compile a detection regex with RE2 when installed, else Python re
+    
+    RE2 matches in linear time, so patterns with several unbounded '.*'
+    can't backtrack catastrophically on hostile input. Patterns RE2
+    rejects fall back to re.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(('(?i)' if flags & re.IGNORECASE else '') + regex)
+        except Exception:
+            pass
+    return re.compile(regex, flags)
+
+
+def _compile_forbidden(patterns: Dict[str, str],
+                       literals: Dict[str, Tuple[str, ...]]) -> Tuple[List[Tuple[str, "re.Pattern", Tuple[str, ...]]], "re.Pattern"]:
+    """
+    Compile forbidden patterns once
+    
+    Args:
+        patterns: Pattern name -> regex
+        literals: Pattern name -> lowercase substrings, one of which any
+            match must contain (patterns without an entry are always tried)
+    
+    Returns:
+        ([(name, compiled, literals)], one fused alternation of every
+        pattern, used as a prefilter: if it misses a line, no individual
+        pattern can hit)
+    """
+    compiled = [
+        (name, _compile_regex(regex, re.IGNORECASE), literals.get(name, ()))
+        for name, regex in patterns.items()
+    ]
+    fused = _compile_regex('|'.join(f'(?:{regex})' for regex in patterns.values()), re.IGNORECASE)
+    return compiled, fused
+
+
+def _compile_dangerous(patterns: Dict[str, Tuple[str, str]]) -> List[Tuple[str, "re.Pattern", str]]:
+    """Compile dangerous-call patterns, keeping each one's required literal"""
+    return [(name, _compile_regex(regex), literal) for name, (regex, literal) in patterns.items()]
+
+
+def _compile_credentials(patterns: Dict[str, Tuple[str, Tuple[str, ...]]]) -> List[Tuple[str, "re.Pattern", Tuple[str, ...]]]:
+    """Compile hardcoded-credential patterns, keeping each one's literals"""
+    return [
+        (name, _compile_regex(regex, re.IGNORECASE), literals)
+        for name, (regex, literals) in patterns.items()
+    ]
+
 
 class CodeVerifier:
     """
@@ -71,22 +265,96 @@ class CodeVerifier:
         '127_0_0_1': ['config', 'development', 'test']
     }
     
-    def __init__(self, memory_system=None, strict_mode: bool = True):
+    # Lowercase literals at least one of which every match must contain;
+    # a substring test is far cheaper than a regex search on a miss
+    PATTERN_LITERALS = {
+        'TODO': ('todo',),
+        'FIXME': ('fixme',),
+        'XXX': ('xxx',),
+        'HACK': ('hack',),
+        'stub': ('stub',),
+        'mock': ('mock',),
+        'fake': ('fake',),
+        'dummy': ('dummy',),
+        'placeholder': ('placeholder',),
+        'not_implemented': ('implemented',),
+        'pass_only': ('pass',),
+        'ellipsis': ('...',),
+        'raise_not_implemented': ('notimplementederror',),
+        'empty_except': ('except',),
+        'bare_except': ('except',),
+        'todo_comment': ('#',),
+        'hardcoded_test': ('test',),
+        'example_com': ('example.',),
+        'localhost_hardcoded': ('localhost',),
+        '127_0_0_1': ('127.0.0.1',),
+        'eval_usage': ('eval',),
+        'exec_usage': ('exec',),
+        'hardcoded_password': ('password', 'passwd', 'pwd'),
+        'hardcoded_api_key': ('key',),
+        'hardcoded_secret': ('secret', 'token'),
+    }
+    
+    # Dangerous calls flagged by the security stage: name -> (regex, required
+    # literal). The regexes are case-sensitive, so the literal is an exact guard.
+    DANGEROUS_PATTERNS = {
+        'eval': (r'\beval\s*\(', 'eval'),
+        'exec': (r'\bexec\s*\(', 'exec'),
+        'compile': (r'\bcompile\s*\(', 'compile'),
+        '__import__': (r'__import__\s*\(', '__import__'),
+        'os.system': (r'os\.system\s*\(', 'os.system'),
+        'subprocess.shell': (r'shell\s*=\s*True', 'shell'),
+        'pickle.loads': (r'pickle\.loads\s*\(', 'pickle.loads'),
+    }
+    
+    # Hardcoded credential assignments flagged by the security stage:
+    # name -> (case-insensitive regex, lowercase literals one of which a match contains)
+    CREDENTIAL_PATTERNS = {
+        'password': (r'(password|passwd|pwd)\s*=\s*["\'][^"\']+["\']', ('password', 'passwd', 'pwd')),
+        'api_key': (r'(api[_\s]?key|apikey)\s*=\s*["\'][^"\']+["\']', ('key',)),
+        'secret': (r'(secret|token)\s*=\s*["\'][^"\']+["\']', ('secret', 'token')),
+        'private_key': (r'(private[_\s]?key)\s*=\s*["\'][^"\']+["\']', ('private',)),
+    }
+    
+    # Compiled FORBIDDEN_PATTERNS and their fused prefilter
+    _COMPILED_PATTERNS, _FUSED = _compile_forbidden(FORBIDDEN_PATTERNS, PATTERN_LITERALS)
+    _COMPILED_DANGEROUS = _compile_dangerous(DANGEROUS_PATTERNS)
+    _COMPILED_CREDENTIALS = _compile_credentials(CREDENTIAL_PATTERNS)
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Keep the compiled patterns in sync with overridden patterns/literals
+        if 'FORBIDDEN_PATTERNS' in cls.__dict__ or 'PATTERN_LITERALS' in cls.__dict__:
+            cls._COMPILED_PATTERNS, cls._FUSED = _compile_forbidden(
+                cls.FORBIDDEN_PATTERNS, cls.PATTERN_LITERALS
+            )
+        if 'DANGEROUS_PATTERNS' in cls.__dict__:
+            cls._COMPILED_DANGEROUS = _compile_dangerous(cls.DANGEROUS_PATTERNS)
+        if 'CREDENTIAL_PATTERNS' in cls.__dict__:
+            cls._COMPILED_CREDENTIALS = _compile_credentials(cls.CREDENTIAL_PATTERNS)
+    
+    def __init__(self, memory_system=None, strict_mode: bool = True,
+                 strict_isolation: bool = True):
         """
         Initialize the code verifier
         
         Args:
             memory_system: Optional memory system for storing results
             strict_mode: Whether to use strict verification rules
+            strict_isolation: Run each sandbox execution in a fresh
+                interpreter. When False, executions reuse a pool of worker
+                processes (much faster, but snippets share a worker's state)
         """
         self.memory_system = memory_system
         self.strict_mode = strict_mode
-        self.verification_cache = {}
+        self.strict_isolation = strict_isolation
         
     def verify_code(self, 
                    code: str, 
                    file_path: Optional[str] = None,
-                   language: str = "python") -> Dict[str, Any]:
+                   language: str = "python",
+                   force: bool = False,
+                   fast_fail: bool = False) -> Dict[str, Any]:
         """
         Complete verification pipeline
         
@@ -94,17 +362,43 @@ class CodeVerifier:
             code: Code to verify
             file_path: Optional file path for context
             language: Programming language
+            force: Re-verify even if a cached result exists (the new
+                result still replaces the cached one)
+            fast_fail: In strict mode, return as soon as a stage has
+                failed the code, skipping the remaining (costlier) stages
             
         Returns:
             Verification results dictionary
         """
-        # Generate code hash for caching
-        code_hash = hashlib.sha256(code.encode()).hexdigest()[:16]
+        return self._verify_code_with_tree(code, None, file_path, language, force,
+                                           fast_fail=fast_fail)
+    
+    def _verify_code_with_tree(self,
+                               code: str,
+                               tree: Optional[ast.AST],
+                               file_path: Optional[str] = None,
+                               language: str = "python",
+                               force: bool = False,
+                               exec_result: Optional[Dict[str, Any]] = None,
+                               fast_fail: bool = False) -> Dict[str, Any]:
+        """
+        verify_code, reusing an already parsed tree of code when given
+        
+        exec_result, when given, is a finished _sandbox_execute result for
+        code that step 4 uses instead of executing it again.
+        """
+        # Generate code hash for caching (16 hex chars, as before)
+        code_hash = hashlib.blake2b(code.encode(), digest_size=8).hexdigest()
+        
+        cache_key = self._cache_key(code_hash, file_path, language, fast_fail)
+        stop_early = fast_fail and self.strict_mode
         
         # Check cache
-        if code_hash in self.verification_cache:
-            logger.info(f"Using cached verification for {code_hash}")
-            return self.verification_cache[code_hash]
+        if not force:
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                logger.info(f"Using cached verification for {code_hash}")
+                return cached
         
         result = {
             'passed': True,
@@ -130,13 +424,16 @@ class CodeVerifier:
         
         # Step 2: AST analysis (for Python)
         if language == "python":
-            ast_result = self._analyze_ast(code)
+            ast_result = self._analyze_ast(code, tree)
             if not ast_result['valid']:
                 result['passed'] = False
                 result['ast_issues'] = ast_result['issues']
                 result['violations'].extend(ast_result['issues'])
                 result['confidence'] *= 0.7
         
+        if stop_early and not result['passed']:
+            return self._record_result(result, cache_key, code_hash, file_path, language)
+        
         # Step 3: Security check
         security_result = self._check_security(code)
         if security_result['has_issues']:
@@ -146,17 +443,107 @@ class CodeVerifier:
                 result['passed'] = False
                 result['confidence'] *= 0.3
         
+        if stop_early and not result['passed']:
+            return self._record_result(result, cache_key, code_hash, file_path, language)
+        
         # Step 4: Sandbox execution (if Python)
         if language == "python" and self.strict_mode:
-            exec_result = self._sandbox_execute(code)
+            if exec_result is None:
+                exec_result = self._sandbox_execute(code)
             result['execution_result'] = exec_result
             if not exec_result['success']:
                 result['passed'] = False
                 result['violations'].append(f"Execution failed: {exec_result.get('error', 'Unknown error')}")
                 result['confidence'] *= 0.4
         
+        return self._record_result(result, cache_key, code_hash, file_path, language)
+    
+    def _cache_key(self, code_hash: str, file_path: Optional[str], language: str,
+                   fast_fail: bool) -> tuple:
+        """Key of a verification result in the shared cache"""
+        # The file path only matters through which patterns it allows
+        return (type(self), code_hash, language, self.strict_mode,
+                self.strict_isolation, fast_fail, self._allowed_patterns(file_path))
+    
+    def verify_many(self,
+                    items: List[Tuple[str, Optional[str], str]],
+                    max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Verify a batch of code items
+        
+        Cached results are reused and duplicate items verified once. Sandbox
+        executions are started from this process (sharing the sandbox pool
+        when strict_isolation is off), while the pattern/AST/security stages
+        run on a process pool. New results are cached and stored in memory
+        as verify_code does.
+        
+        Args:
+            items: (code, file_path, language) tuples
+            max_workers: Number of worker processes (default: CPU count)
+            
+        Returns:
+            Verification results, in the order of items
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        pending: Dict[tuple, Tuple[str, str, Optional[str], str, List[int]]] = {}
+        
+        for index, (code, file_path, language) in enumerate(items):
+            code_hash = hashlib.blake2b(code.encode(), digest_size=8).hexdigest()
+            cache_key = self._cache_key(code_hash, file_path, language, False)
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                results[index] = cached
+            elif cache_key in pending:
+                pending[cache_key][4].append(index)
+            else:
+                pending[cache_key] = (code, code_hash, file_path, language, [index])
+        
+        if pending:
+            work = list(pending.values())
+            workers = max_workers or os.cpu_count() or 1
+            
+            # Executions are spent waiting on sandbox processes
+            executions: List[Optional[Dict[str, Any]]] = [None] * len(work)
+            to_run = [i for i, (_, _, _, language, _) in enumerate(work)
+                      if language == "python" and self.strict_mode]
+            if to_run:
+                with ThreadPoolExecutor(max_workers=min(len(to_run), workers)) as executor:
+                    done = executor.map(self._sandbox_execute, [work[i][0] for i in to_run])
+                    for i, execution in zip(to_run, done):
+                        executions[i] = execution
+            
+            args = [(code, file_path, language, execution)
+                    for (code, _, file_path, language, _), execution in zip(work, executions)]
+            if workers > 1 and len(args) > 1:
+                # ~4 chunks per worker balances load against IPC overhead
+                chunksize = max(1, len(args) // (4 * workers))
+                with ProcessPoolExecutor(max_workers=min(workers, len(args)),
+                                         mp_context=multiprocessing.get_context('spawn'),
+                                         initializer=_init_worker,
+                                         initargs=(type(self), self.strict_mode, self.strict_isolation)) as executor:
+                    verified = list(executor.map(_verify_one, args, chunksize=chunksize))
+            else:
+                verified = [
+                    self._verify_code_with_tree(code, None, file_path, language, True, execution)
+                    for code, file_path, language, execution in args
+                ]
+            
+            for (cache_key, (_, code_hash, file_path, language, indices)), result in zip(pending.items(), verified):
+                self._record_result(result, cache_key, code_hash, file_path, language)
+                for index in indices:
+                    results[index] = result
+        
+        return results
+    
+    def _record_result(self, result: Dict[str, Any], cache_key: tuple, code_hash: str,
+                       file_path: Optional[str], language: str) -> Dict[str, Any]:
+        """Cache a finished verification result and store it in memory"""
         # Store in cache
-        self.verification_cache[code_hash] = result
+        with _VERIFY_CACHE_LOCK:
+            _VERIFY_CACHE[cache_key] = result
+            _VERIFY_CACHE.move_to_end(cache_key)
+            if len(_VERIFY_CACHE) > _VERIFY_CACHE_SIZE:
+                _VERIFY_CACHE.popitem(last=False)
         
         # Store in memory if available
         if self.memory_system:
@@ -180,32 +567,51 @@ class CodeVerifier:
     def _check_patterns(self, code: str, file_path: Optional[str] = None) -> Dict[str, Any]:
         """Check for forbidden patterns in code"""
         violations = []
-        lines = code.split('\n')
         
-        for line_num, line in enumerate(lines, 1):
+        # file_path is fixed for the whole scan: drop its allowed patterns up front
+        allowed_here = self._allowed_patterns(file_path)
+        active_patterns = [
+            entry for entry in self._COMPILED_PATTERNS if entry[0] not in allowed_here
+        ]
+        
+        # Stream lines ('\n'-separated, as str.split would give) instead of
+        # materializing them all
+        for line_num, line in enumerate(io.StringIO(code, newline='\n'), 1):
             # Skip empty lines
             if not line.strip():
                 continue
+            line = line.rstrip('\n')
             
             # Strip strings and comments for accurate pattern matching
             cleaned_line = self._strip_strings_and_comments(line)
             
-            for pattern_name, pattern_regex in self.FORBIDDEN_PATTERNS.items():
-                # Check if pattern is in allowed context
-                if file_path and self._is_allowed_context(pattern_name, file_path):
-                    continue
-                
-                # Check if pattern is only in strings/comments (acceptable)
-                if self._is_only_in_strings_or_comments(line, pattern_regex):
+            # Only patterns whose required literal is present can match. Lowercasing
+            # is only equivalent to re.IGNORECASE for ASCII, so other lines try all.
+            if cleaned_line.isascii():
+                lower = cleaned_line.lower()
+                candidates = [
+                    (pattern_name, pattern_regex)
+                    for pattern_name, pattern_regex, literals in active_patterns
+                    if not literals or any(lit in lower for lit in literals)
+                ]
+                if not candidates:
                     continue
-                
-                # Check for pattern match
-                if re.search(pattern_regex, cleaned_line, re.IGNORECASE):
+            else:
+                candidates = [entry[:2] for entry in active_patterns]
+            
+            # One regex call rules out the common clean line
+            if not self._FUSED.search(cleaned_line):
+                continue
+            
+            for pattern_name, pattern_regex in candidates:
+                # Check for pattern match; matching the cleaned line already
+                # ignores hits that are only in strings/comments
+                if pattern_regex.search(cleaned_line):
                     violations.append({
                         'line': line_num,
                         'pattern': pattern_name,
                         'content': line.strip(),
-                        'message': f"Forbidden pattern '{pattern_name}' found at line {line_num}"
+                        'message': _mkmsg(pattern_name, line_num)
                     })
         
         return {
@@ -215,28 +621,36 @@ class CodeVerifier:
     
     def _strip_strings_and_comments(self, line: str) -> str:
         """Remove string literals and comments from a line"""
+        # Most lines have nothing to strip
+        if '#' not in line and '"' not in line and "'" not in line:
+            return line
+        
         # Remove single-line comments
-        if '#' in line:
-            line = line[:line.index('#')]
+        hash_pos = line.find('#')
+        if hash_pos != -1:
+            line = line[:hash_pos]
         
         # Remove string literals (simplified)
         # This is a basic implementation - could be enhanced
-        line = re.sub(r'"[^"]*"', '""', line)
-        line = re.sub(r"'[^']*'", "''", line)
-        line = re.sub(r'""".*?"""', '""""""', line, flags=re.DOTALL)
-        line = re.sub(r"'''.*?'''", "''''''", line, flags=re.DOTALL)
+        line = _DQ_STRING_RE.sub('""', line)
+        line = _SQ_STRING_RE.sub("''", line)
+        # The passes above leave quotes paired, so a triple-quote match
+        # needs a run of 3+ quotes; skip the regex calls without one
+        if '"""' in line:
+            line = _TDQ_STRING_RE.sub('""""""', line)
+        if "'''" in line:
+            line = _TSQ_STRING_RE.sub("''''''", line)
         
         return line
     
-    def _is_only_in_strings_or_comments(self, line: str, pattern: str) -> bool:
-        """Check if pattern only appears in strings or comments"""
-        # Check if pattern is in the line at all
-        if not re.search(pattern, line, re.IGNORECASE):
-            return False
-        
-        # Check if it's in cleaned line (not in strings/comments)
-        cleaned = self._strip_strings_and_comments(line)
-        return not re.search(pattern, cleaned, re.IGNORECASE)
+    def _allowed_patterns(self, file_path: Optional[str]) -> frozenset:
+        """Names of the patterns that file_path's context allows"""
+        if not file_path:
+            return frozenset()
+        return frozenset(
+            name for name in self.ALLOWED_CONTEXTS
+            if self._is_allowed_context(name, file_path)
+        )
     
     def _is_allowed_context(self, pattern_name: str, file_path: str) -> bool:
         """Check if pattern is allowed in this context"""
@@ -250,38 +664,43 @@ class CodeVerifier:
         
         return False
     
-    def _analyze_ast(self, code: str) -> Dict[str, Any]:
-        """Analyze Python code AST for structural issues"""
+    def _analyze_ast(self, code: str, tree: Optional[ast.AST] = None) -> Dict[str, Any]:
+        """Analyze Python code AST for structural issues (tree: code, pre-parsed)"""
         issues = []
         
-        try:
-            tree = ast.parse(code)
-        except SyntaxError as e:
-            return {
-                'valid': False,
-                'issues': [f"Syntax error: {e}"]
-            }
+        if tree is None:
+            try:
+                tree = ast.parse(code)
+            except SyntaxError as e:
+                return {
+                    'valid': False,
+                    'issues': [f"Syntax error: {e}"]
+                }
         
-        # Check for various AST patterns
+        # Check for various AST patterns. ast.walk is iterative, so deeply
+        # nested (but parseable) code can't overflow the stack the way a
+        # recursive NodeVisitor does; exact type tests keep dispatch cheap.
         for node in ast.walk(tree):
+            node_type = type(node)
+            
             # Check for empty functions (only pass)
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if len(node.body) == 1 and isinstance(node.body[0], ast.Pass):
+            if node_type is ast.FunctionDef or node_type is ast.AsyncFunctionDef:
+                if len(node.body) == 1 and type(node.body[0]) is ast.Pass:
                     issues.append(f"Empty function '{node.name}' with only 'pass'")
             
             # Check for empty classes
-            if isinstance(node, ast.ClassDef):
-                if len(node.body) == 1 and isinstance(node.body[0], ast.Pass):
+            elif node_type is ast.ClassDef:
+                if len(node.body) == 1 and type(node.body[0]) is ast.Pass:
                     issues.append(f"Empty class '{node.name}' with only 'pass'")
             
             # Check for NotImplementedError
-            if isinstance(node, ast.Raise):
-                if node.exc and isinstance(node.exc, ast.Call):
-                    if hasattr(node.exc.func, 'id') and node.exc.func.id == 'NotImplementedError':
+            elif node_type is ast.Raise:
+                if node.exc and type(node.exc) is ast.Call:
+                    if type(node.exc.func) is ast.Name and node.exc.func.id == 'NotImplementedError':
                         issues.append("NotImplementedError found - incomplete implementation")
             
             # Check for bare except clauses
-            if isinstance(node, ast.ExceptHandler):
+            elif node_type is ast.ExceptHandler:
                 if node.type is None:
                     issues.append("Bare except clause found - too broad exception handling")
         
@@ -294,32 +713,20 @@ class CodeVerifier:
         """Check for security vulnerabilities"""
         issues = []
         
-        # Check for dangerous functions
-        dangerous_patterns = {
-            'eval': r'\beval\s*\(',
-            'exec': r'\bexec\s*\(',
-            'compile': r'\bcompile\s*\(',
-            '__import__': r'__import__\s*\(',
-            'os.system': r'os\.system\s*\(',
-            'subprocess.shell': r'shell\s*=\s*True',
-            'pickle.loads': r'pickle\.loads\s*\(',
-        }
-        
-        for name, pattern in dangerous_patterns.items():
-            if re.search(pattern, code):
+        # Check for dangerous functions; a substring miss skips the regex scan
+        for name, pattern, literal in self._COMPILED_DANGEROUS:
+            if literal in code and pattern.search(code):
                 issues.append(f"Potentially dangerous function: {name}")
         
-        # Check for hardcoded credentials
-        credential_patterns = {
-            'password': r'(password|passwd|pwd)\s*=\s*["\'][^"\']+["\']',
-            'api_key': r'(api[_\s]?key|apikey)\s*=\s*["\'][^"\']+["\']',
-            'secret': r'(secret|token)\s*=\s*["\'][^"\']+["\']',
-            'private_key': r'(private[_\s]?key)\s*=\s*["\'][^"\']+["\']',
-        }
-        
-        for name, pattern in credential_patterns.items():
+        # Check for hardcoded credentials. Lowercasing only matches
+        # re.IGNORECASE for ASCII, so other code skips the literal test.
+        lower = code.lower() if code.isascii() else None
+        for name, pattern, literals in self._COMPILED_CREDENTIALS:
+            if lower is not None and not any(lit in lower for lit in literals):
+                continue
+            
             # Skip if it's a variable assignment to another variable
-            matches = re.finditer(pattern, code, re.IGNORECASE)
+            matches = pattern.finditer(code)
             for match in matches:
                 value = match.group()
                 # Check if it's actually a hardcoded value (not empty or placeholder)
@@ -348,36 +755,59 @@ class CodeVerifier:
             'timeout': False
         }
         
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(code)
-            temp_file = f.name
+        if not self.strict_isolation:
+            return self._pool_execute(code, timeout, result)
         
         try:
-            # Run in subprocess with timeout
+            # Feed the code through stdin in isolated mode (-I): no temp
+            # file, and neither the cwd nor PYTHON* env vars leak in
             process = subprocess.Popen(
-                ['python3', temp_file],
+                ['python3', '-I', '-'],
+                stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True
             )
             
             try:
-                stdout, stderr = process.communicate(timeout=timeout)
+                stdout, stderr = process.communicate(input=code, timeout=timeout)
                 result['success'] = process.returncode == 0
                 result['output'] = stdout
                 result['error'] = stderr
             except subprocess.TimeoutExpired:
                 process.kill()
+                process.communicate()
                 result['timeout'] = True
                 result['error'] = f"Execution timed out after {timeout} seconds"
         
         except Exception as e:
             result['error'] = str(e)
         
-        finally:
-            # Clean up temp file
-            Path(temp_file).unlink(missing_ok=True)
+        return result
+    
+    def _pool_execute(self, code: str, timeout: int, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute code on a persistent sandbox worker"""
+        deadline = time.monotonic() + timeout
+        try:
+            pool = _get_sandbox_pool()
+            pending = pool.apply_async(_run_code, (code,))
+            while not pending.ready():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    # The worker is still busy with the code; replace the pool
+                    _reset_sandbox_pool(pool)
+                    result['timeout'] = True
+                    result['error'] = f"Execution timed out after {timeout} seconds"
+                    return result
+                pending.wait(min(remaining, _SANDBOX_POLL_INTERVAL))
+                if not pending.ready() and _sandbox_pool_replaced(pool):
+                    # Another caller's timeout terminated this pool, taking
+                    # our task with it; run again on the new pool
+                    pool = _get_sandbox_pool()
+                    pending = pool.apply_async(_run_code, (code,))
+            result.update(pending.get())
+        except Exception as e:
+            result['error'] = str(e)
         
         return result
     
@@ -395,13 +825,20 @@ class CodeVerifier:
             'confidence_scores': []
         }
         
-        for run_num in range(runs):
+        # Only sandbox execution can differ between runs, and it is spent
+        # waiting on a subprocess, so the executions run concurrently
+        if self.strict_mode and runs > 1:
+            # Bounded: runs comes from callers (e.g. MCP tool arguments)
+            with ThreadPoolExecutor(max_workers=min(runs, os.cpu_count() or 1)) as executor:
+                executions = list(executor.map(self._sandbox_execute, [code] * runs))
+        else:
+            executions = [None] * runs
+        
+        for run_num, execution in enumerate(executions):
             logger.info(f"Skepticism run {run_num + 1}/{runs}")
             
-            # Clear cache to force re-verification
-            self.verification_cache.clear()
-            
-            result = self.verify_code(code)
+            # Bypass the cache to force re-verification
+            result = self._verify_code_with_tree(code, None, force=True, exec_result=execution)
             all_results.append(result)
             
             if not result['passed']:
@@ -428,32 +865,54 @@ class CodeVerifier:
     
     def generate_forensic_report(self, code: str) -> Dict[str, Any]:
         """Generate detailed forensic analysis of code"""
-        code_hash = hashlib.sha256(code.encode()).hexdigest()
-        lines = code.split('\n')
+        code_hash = hashlib.blake2b(code.encode(), digest_size=32).hexdigest()
+        # Parse once for both verification and the AST summary
+        try:
+            tree = ast.parse(code)
+        except Exception:
+            tree = None
         
         # Perform verification
-        verification = self.verify_code(code)
-        
-        # Analyze code metrics
+        verification = self._verify_code_with_tree(code, tree)
+        
+        # Analyze code metrics in one pass over the lines
+        non_empty_lines = comment_lines = import_count = 0
+        for line in io.StringIO(code, newline='\n'):
+            stripped = line.strip()
+            if stripped:
+                non_empty_lines += 1
+                if stripped[0] == '#':
+                    comment_lines += 1
+                elif stripped.startswith(('import ', 'from ')):
+                    import_count += 1
         metrics = {
-            'line_count': len(lines),
+            'line_count': code.count('\n') + 1,
             'char_count': len(code),
-            'non_empty_lines': sum(1 for line in lines if line.strip()),
-            'comment_lines': sum(1 for line in lines if line.strip().startswith('#')),
-            'import_count': sum(1 for line in lines if line.strip().startswith(('import ', 'from ')))
+            'non_empty_lines': non_empty_lines,
+            'comment_lines': comment_lines,
+            'import_count': import_count
         }
         
-        # AST analysis for Python
-        ast_info = {}
-        try:
-            tree = ast.parse(code)
+        # AST analysis for Python, in a single walk
+        if tree is not None:
+            node_count = 0
+            functions, classes, imports = [], [], []
+            for node in ast.walk(tree):
+                node_count += 1
+                node_type = type(node)
+                if node_type is ast.FunctionDef:
+                    functions.append(node.name)
+                elif node_type is ast.ClassDef:
+                    classes.append(node.name)
+                elif node_type is ast.Import:
+                    imports.append(node.names[0].name)
             ast_info = {
-                'ast_node_count': sum(1 for _ in ast.walk(tree)),
-                'functions': [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)],
-                'classes': [node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)],
-                'imports': [node.names[0].name for node in ast.walk(tree) if isinstance(node, ast.Import)]
+                'ast_node_count': node_count,
+                'functions': functions,
+                'classes': classes,
+                'imports': imports
             }
-        except:
+        else:
             ast_info = {'error': 'Failed to parse AST'}
         
         return {
@@ -6,10 +6,14 @@ Main entry point for Claude Desktop integration
 import os
 import sys
 import json
+import time
+import shutil
 import logging
 import asyncio
+import dataclasses
+from enum import Enum
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 # Add the project root to Python path
@@ -30,6 +34,105 @@ from hermetic_ai_mcp.core.platform import HermeticAIPlatform
 from hermetic_ai_mcp.core.memory_system import MemoryType, MemoryScope
 from hermetic_ai_mcp.core.verification_engine import CodeVerifier
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Tool argument values -> memory enums; searching scope "all" means no
+# scope filter
+_SCOPE_MAP = {
+    "universal": MemoryScope.UNIVERSAL,
+    "project": MemoryScope.PROJECT,
+    "all": None
+}
+_STORE_SCOPE_MAP = {
+    "universal": MemoryScope.UNIVERSAL,
+    "project": MemoryScope.PROJECT
+}
+_TYPE_MAP = {
+    "pattern": MemoryType.PATTERN,
+    "error": MemoryType.ERROR,
+    "command": MemoryType.COMMAND,
+    "architecture": MemoryType.ARCHITECTURE,
+    "thought": MemoryType.THOUGHT,
+    "verification": MemoryType.VERIFICATION
+}
+
+# Upper bound on verify_with_skepticism runs (each run executes the code)
+_MAX_SKEPTICISM_RUNS = 10
+
+# Tool input schemas (enum values come from the argument maps above)
+_SCHEMA_SEQUENTIAL_THINKING = {
+    "type": "object",
+    "properties": {
+        "thought": {"type": "string", "description": "The current thought"},
+        "thoughtNumber": {"type": "integer", "description": "Current thought number"},
+        "totalThoughts": {"type": "integer", "description": "Total expected thoughts"},
+        "nextThoughtNeeded": {"type": "boolean", "description": "Whether another thought is needed"},
+        "isRevision": {"type": "boolean", "description": "Whether this revises previous thinking"},
+        "revisesThought": {"type": "integer", "description": "Which thought is being revised"},
+        "branchFromThought": {"type": "integer", "description": "Branching point"},
+        "branchId": {"type": "string", "description": "Branch identifier"}
+    },
+    "required": ["thought", "thoughtNumber", "totalThoughts", "nextThoughtNeeded"]
+}
+_SCHEMA_VERIFY_CODE = {
+    "type": "object",
+    "properties": {
+        "code": {"type": "string", "description": "Code to verify"},
+        "file_path": {"type": "string", "description": "Optional file path"},
+        "language": {"type": "string", "description": "Programming language", "default": "python"}
+    },
+    "required": ["code"]
+}
+_SCHEMA_VERIFY_WITH_SKEPTICISM = {
+    "type": "object",
+    "properties": {
+        "code": {"type": "string", "description": "Code to verify"},
+        "runs": {"type": "integer", "description": "Number of verification runs", "default": 3,
+                 "minimum": 1, "maximum": _MAX_SKEPTICISM_RUNS}
+    },
+    "required": ["code"]
+}
+_SCHEMA_SEARCH_MEMORY = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string", "description": "Search query"},
+        "scope": {"type": "string", "enum": list(_SCOPE_MAP), "default": "all"},
+        "memory_type": {"type": "string", "enum": list(_TYPE_MAP)},
+        "limit": {"type": "integer", "default": 10}
+    },
+    "required": ["query"]
+}
+_SCHEMA_STORE_MEMORY = {
+    "type": "object",
+    "properties": {
+        "content": {"type": "string", "description": "Content to store"},
+        "memory_type": {"type": "string", "enum": list(_TYPE_MAP)},
+        "scope": {"type": "string", "enum": list(_STORE_SCOPE_MAP), "default": "project"},
+        "metadata": {"type": "object", "description": "Additional metadata"}
+    },
+    "required": ["content", "memory_type"]
+}
+_SCHEMA_DETECT_PROJECT = {
+    "type": "object",
+    "properties": {
+        "path": {"type": "string", "description": "Project path (defaults to current directory)"}
+    }
+}
+_SCHEMA_GET_PLATFORM_STATUS = {
+    "type": "object",
+    "properties": {}
+}
+_SCHEMA_GENERATE_FORENSIC_REPORT = {
+    "type": "object",
+    "properties": {
+        "code": {"type": "string", "description": "Code to analyze"}
+    },
+    "required": ["code"]
+}
+
 # Configure logging - CRITICAL: Don't log to stderr in production as it interferes with MCP protocol
 # Only enable logging if DEBUG environment variable is set
 if os.environ.get('DEBUG_MCP'):
@@ -45,6 +148,35 @@ else:
     logger = logging.getLogger(__name__)
 
 
+def _json_default(obj: Any) -> Any:
+    """Convert the non-JSON types found in tool results"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any, indent: bool = True) -> str:
+    """Serialize a response payload to JSON text (indented unless indent=False), via orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option, default=_json_default).decode()
+    return json.dumps(data, indent=2 if indent else None, default=_json_default)
+
+
+# How long a serialized platform status is reused (status gets polled)
+_STATUS_TTL = 0.5
+
+# Constant error payloads, serialized once
+_ERR_PLATFORM = _dumps({"error": "Platform not initialized"}, indent=False)
+_ERR_MEMORY = _dumps({"error": "Memory system not initialized"}, indent=False)
+
+
 class HermeticMCPServer:
     """MCP Server for Hermetic AI Platform"""
     
@@ -54,382 +186,370 @@ class HermeticMCPServer:
         self.platform: Optional[HermeticAIPlatform] = None
         self.verifier: Optional[CodeVerifier] = None
         self.session_id: Optional[str] = None
+        self._status_cache: Optional[Tuple[float, str]] = None
+        
+        # Directory the client launched the server from
+        self._cwd = os.getcwd()
+        
+        # The resource and tool lists never change; build them once
+        self._resources_cache = self._build_resources()
+        self._tools_cache = self._build_tools()
+        
+        # Dispatch tables for resource reads and tool calls
+        self._resource_handlers = {
+            "hermetic://platform/status": self._resource_platform_status,
+            "hermetic://memory/universal": self._resource_universal_memory,
+            "hermetic://memory/project": self._resource_project_memory,
+            "hermetic://verification/history": self._resource_verification_history
+        }
+        self._tool_handlers = {
+            "sequential_thinking": self._tool_sequential_thinking,
+            "verify_code": self._tool_verify_code,
+            "verify_with_skepticism": self._tool_verify_with_skepticism,
+            "search_memory": self._tool_search_memory,
+            "store_memory": self._tool_store_memory,
+            "detect_project": self._tool_detect_project,
+            "get_platform_status": self._tool_get_platform_status,
+            "generate_forensic_report": self._tool_generate_forensic_report
+        }
         
         # Register handlers
         self._register_handlers()
     
+    def _build_resources(self) -> List[Resource]:
+        """Build the (static) resource list"""
+        return [
+            Resource(
+                uri="hermetic://platform/status",
+                name="Platform Status",
+                description="Current platform status and session info",
+                mimeType="application/json"
+            ),
+            Resource(
+                uri="hermetic://memory/universal",
+                name="Universal Memory",
+                description="Access universal memory patterns",
+                mimeType="application/json"
+            ),
+            Resource(
+                uri="hermetic://memory/project",
+                name="Project Memory",
+                description="Access project-specific memory",
+                mimeType="application/json"
+            ),
+            Resource(
+                uri="hermetic://verification/history",
+                name="Verification History",
+                description="Code verification history",
+                mimeType="application/json"
+            )
+        ]
+    
+    def _build_tools(self) -> List[Tool]:
+        """Build the (static) tool list"""
+        return [
+            Tool(
+                name="sequential_thinking",
+                description="Process a thought step in sequential thinking",
+                inputSchema=_SCHEMA_SEQUENTIAL_THINKING
+            ),
+            Tool(
+                name="verify_code",
+                description="Verify code for quality, security, and completeness",
+                inputSchema=_SCHEMA_VERIFY_CODE
+            ),
+            Tool(
+                name="verify_with_skepticism",
+                description="Run multiple verification passes with skepticism",
+                inputSchema=_SCHEMA_VERIFY_WITH_SKEPTICISM
+            ),
+            Tool(
+                name="search_memory",
+                description="Search platform memory",
+                inputSchema=_SCHEMA_SEARCH_MEMORY
+            ),
+            Tool(
+                name="store_memory",
+                description="Store information in memory",
+                inputSchema=_SCHEMA_STORE_MEMORY
+            ),
+            Tool(
+                name="detect_project",
+                description="Detect and analyze current project",
+                inputSchema=_SCHEMA_DETECT_PROJECT
+            ),
+            Tool(
+                name="get_platform_status",
+                description="Get current platform status",
+                inputSchema=_SCHEMA_GET_PLATFORM_STATUS
+            ),
+            Tool(
+                name="generate_forensic_report",
+                description="Generate detailed forensic analysis of code",
+                inputSchema=_SCHEMA_GENERATE_FORENSIC_REPORT
+            )
+        ]
+    
     def _register_handlers(self):
         """Register all MCP handlers"""
         
         @self.server.list_resources()
         async def handle_list_resources() -> List[Resource]:
             """List available resources"""
-            resources = [
-                Resource(
-                    uri="hermetic://platform/status",
-                    name="Platform Status",
-                    description="Current platform status and session info",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="hermetic://memory/universal",
-                    name="Universal Memory",
-                    description="Access universal memory patterns",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="hermetic://memory/project",
-                    name="Project Memory",
-                    description="Access project-specific memory",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="hermetic://verification/history",
-                    name="Verification History",
-                    description="Code verification history",
-                    mimeType="application/json"
-                )
-            ]
-            return resources
+            return self._resources_cache
         
         @self.server.read_resource()
         async def handle_read_resource(uri: str) -> str:
             """Read a specific resource"""
             if not self.platform:
-                return json.dumps({"error": "Platform not initialized"})
-            
-            if uri == "hermetic://platform/status":
-                return json.dumps(self.platform.get_platform_status(), indent=2)
-            
-            elif uri == "hermetic://memory/universal":
-                if self.platform.memory_system:
-                    memories = self.platform.memory_system.search(
-                        query="*",
-                        scope=MemoryScope.UNIVERSAL,
-                        limit=50
-                    )
-                    return json.dumps({
-                        "count": len(memories),
-                        "memories": [
-                            {
-                                "id": m.id,
-                                "type": m.type.value,
-                                "content": m.content[:200],
-                                "created": m.created_at,
-                                "confidence": m.confidence_score
-                            }
-                            for m in memories
-                        ]
-                    }, indent=2)
-                return json.dumps({"error": "Memory system not initialized"})
-            
-            elif uri == "hermetic://memory/project":
-                if self.platform.memory_system:
-                    memories = self.platform.memory_system.search(
-                        query="*",
-                        scope=MemoryScope.PROJECT,
-                        limit=50
-                    )
-                    return json.dumps({
-                        "count": len(memories),
-                        "project": self.platform.current_project.project_hash if self.platform.current_project else None,
-                        "memories": [
-                            {
-                                "id": m.id,
-                                "type": m.type.value,
-                                "content": m.content[:200],
-                                "created": m.created_at
-                            }
-                            for m in memories
-                        ]
-                    }, indent=2)
-                return json.dumps({"error": "Memory system not initialized"})
-            
-            elif uri == "hermetic://verification/history":
-                if self.platform.memory_system:
-                    verifications = self.platform.memory_system.search(
-                        query="Verification",
-                        memory_type=MemoryType.VERIFICATION,
-                        limit=20
-                    )
-                    return json.dumps({
-                        "count": len(verifications),
-                        "verifications": [
-                            {
-                                "id": v.id,
-                                "content": v.content,
-                                "metadata": v.metadata,
-                                "created": v.created_at
-                            }
-                            for v in verifications
-                        ]
-                    }, indent=2)
-                return json.dumps({"error": "Memory system not initialized"})
+                return _ERR_PLATFORM
             
-            return json.dumps({"error": f"Unknown resource: {uri}"})
+            handler = self._resource_handlers.get(str(uri))
+            if handler is None:
+                return _dumps({"error": f"Unknown resource: {uri}"}, indent=False)
+            return await handler()
         
         @self.server.list_tools()
         async def handle_list_tools() -> List[Tool]:
             """List available tools"""
-            return [
-                Tool(
-                    name="sequential_thinking",
-                    description="Process a thought step in sequential thinking",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "thought": {"type": "string", "description": "The current thought"},
-                            "thoughtNumber": {"type": "integer", "description": "Current thought number"},
-                            "totalThoughts": {"type": "integer", "description": "Total expected thoughts"},
-                            "nextThoughtNeeded": {"type": "boolean", "description": "Whether another thought is needed"},
-                            "isRevision": {"type": "boolean", "description": "Whether this revises previous thinking"},
-                            "revisesThought": {"type": "integer", "description": "Which thought is being revised"},
-                            "branchFromThought": {"type": "integer", "description": "Branching point"},
-                            "branchId": {"type": "string", "description": "Branch identifier"}
-                        },
-                        "required": ["thought", "thoughtNumber", "totalThoughts", "nextThoughtNeeded"]
-                    }
-                ),
-                Tool(
-                    name="verify_code",
-                    description="Verify code for quality, security, and completeness",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "code": {"type": "string", "description": "Code to verify"},
-                            "file_path": {"type": "string", "description": "Optional file path"},
-                            "language": {"type": "string", "description": "Programming language", "default": "python"}
-                        },
-                        "required": ["code"]
-                    }
-                ),
-                Tool(
-                    name="verify_with_skepticism",
-                    description="Run multiple verification passes with skepticism",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "code": {"type": "string", "description": "Code to verify"},
-                            "runs": {"type": "integer", "description": "Number of verification runs", "default": 3}
-                        },
-                        "required": ["code"]
-                    }
-                ),
-                Tool(
-                    name="search_memory",
-                    description="Search platform memory",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {"type": "string", "description": "Search query"},
-                            "scope": {"type": "string", "enum": ["universal", "project", "all"], "default": "all"},
-                            "memory_type": {"type": "string", "enum": ["pattern", "error", "command", "architecture", "thought", "verification"]},
-                            "limit": {"type": "integer", "default": 10}
-                        },
-                        "required": ["query"]
-                    }
-                ),
-                Tool(
-                    name="store_memory",
-                    description="Store information in memory",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "content": {"type": "string", "description": "Content to store"},
-                            "memory_type": {"type": "string", "enum": ["pattern", "error", "command", "architecture", "thought", "verification"]},
-                            "scope": {"type": "string", "enum": ["universal", "project"], "default": "project"},
-                            "metadata": {"type": "object", "description": "Additional metadata"}
-                        },
-                        "required": ["content", "memory_type"]
-                    }
-                ),
-                Tool(
-                    name="detect_project",
-                    description="Detect and analyze current project",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "path": {"type": "string", "description": "Project path (defaults to current directory)"}
-                        }
-                    }
-                ),
-                Tool(
-                    name="get_platform_status",
-                    description="Get current platform status",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
-                    }
-                ),
-                Tool(
-                    name="generate_forensic_report",
-                    description="Generate detailed forensic analysis of code",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "code": {"type": "string", "description": "Code to analyze"}
-                        },
-                        "required": ["code"]
-                    }
-                )
-            ]
+            return self._tools_cache
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             """Handle tool calls"""
+            if not self.platform:
+                return [TextContent(type="text", text=_ERR_PLATFORM)]
+            
+            # Route tool calls
+            handler = self._tool_handlers.get(name)
+            if handler is None:
+                return [TextContent(type="text", text=_dumps({"error": f"Unknown tool: {name}"}, indent=False))]
+            
             try:
-                if not self.platform:
-                    # Initialize platform on first tool call
-                    self.platform = HermeticAIPlatform(auto_detect=True)
-                    self.verifier = CodeVerifier(memory_system=self.platform.memory_system if self.platform else None)
-                    
-                    # Auto-detect project if in a project directory
-                    cwd = os.getcwd()
-                    self.session_id = self.platform.on_session_start(cwd)
-                    # Platform initialized with session
-                
-                # Route tool calls
-                if name == "sequential_thinking":
-                    result = self.platform.sequential_thinking.process_thought(arguments)
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-                
-                elif name == "verify_code":
-                    result = self.verifier.verify_code(
-                        code=arguments["code"],
-                        file_path=arguments.get("file_path"),
-                        language=arguments.get("language", "python")
-                    )
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-                
-                elif name == "verify_with_skepticism":
-                    result = self.verifier.verify_with_skepticism(
-                        code=arguments["code"],
-                        runs=arguments.get("runs", 3)
-                    )
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-                
-                elif name == "search_memory":
-                    if not self.platform.memory_system:
-                        return [TextContent(type="text", text=json.dumps({"error": "Memory system not initialized"}))]
-                    
-                    scope_map = {
-                        "universal": MemoryScope.UNIVERSAL,
-                        "project": MemoryScope.PROJECT,
-                        "all": MemoryScope.ALL
-                    }
-                    
-                    type_map = {
-                        "pattern": MemoryType.PATTERN,
-                        "error": MemoryType.ERROR,
-                        "command": MemoryType.COMMAND,
-                        "architecture": MemoryType.ARCHITECTURE,
-                        "thought": MemoryType.THOUGHT,
-                        "verification": MemoryType.VERIFICATION
-                    }
-                    
-                    memories = self.platform.memory_system.search(
-                        query=arguments["query"],
-                        scope=scope_map.get(arguments.get("scope", "all"), MemoryScope.ALL),
-                        memory_type=type_map.get(arguments.get("memory_type")),
-                        limit=arguments.get("limit", 10)
-                    )
-                    
-                    result = {
-                        "count": len(memories),
-                        "memories": [
-                            {
-                                "id": m.id,
-                                "scope": m.scope.value,
-                                "type": m.type.value,
-                                "content": m.content,
-                                "metadata": m.metadata,
-                                "created": m.created_at,
-                                "confidence": m.confidence_score
-                            }
-                            for m in memories
-                        ]
+                return await handler(arguments)
+            except Exception as e:
+                # Tool execution error - return error response
+                return [TextContent(type="text", text=_dumps({"error": str(e), "tool": name}, indent=False))]
+    
+    def _status_json(self) -> str:
+        """Serialized platform status, reused for up to _STATUS_TTL seconds"""
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache[0] < _STATUS_TTL:
+            return self._status_cache[1]
+        text = _dumps(self.platform.get_platform_status())
+        self._status_cache = (now, text)
+        return text
+    
+    async def _resource_platform_status(self) -> str:
+        """hermetic://platform/status"""
+        return self._status_json()
+    
+    async def _resource_universal_memory(self) -> str:
+        """hermetic://memory/universal"""
+        if self.platform.memory_system:
+            memories = await asyncio.to_thread(
+                self.platform.memory_system.list_recent,
+                scope=MemoryScope.UNIVERSAL,
+                limit=50
+            )
+            return _dumps({
+                "count": len(memories),
+                "memories": [
+                    {
+                        "id": m.id,
+                        "type": m.type_value,
+                        "content": m.content[:200],
+                        "created": m.created_at,
+                        "confidence": m.confidence_score
                     }
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-                
-                elif name == "store_memory":
-                    if not self.platform.memory_system:
-                        return [TextContent(type="text", text=json.dumps({"error": "Memory system not initialized"}))]
-                    
-                    type_map = {
-                        "pattern": MemoryType.PATTERN,
-                        "error": MemoryType.ERROR,
-                        "command": MemoryType.COMMAND,
-                        "architecture": MemoryType.ARCHITECTURE,
-                        "thought": MemoryType.THOUGHT,
-                        "verification": MemoryType.VERIFICATION
+                    for m in memories
+                ]
+            })
+        return _ERR_MEMORY
+    
+    async def _resource_project_memory(self) -> str:
+        """hermetic://memory/project"""
+        if self.platform.memory_system:
+            memories = await asyncio.to_thread(
+                self.platform.memory_system.list_recent,
+                scope=MemoryScope.PROJECT,
+                limit=50
+            )
+            return _dumps({
+                "count": len(memories),
+                "project": self.platform.current_project.project_hash if self.platform.current_project else None,
+                "memories": [
+                    {
+                        "id": m.id,
+                        "type": m.type_value,
+                        "content": m.content[:200],
+                        "created": m.created_at
                     }
-                    
-                    scope_map = {
-                        "universal": MemoryScope.UNIVERSAL,
-                        "project": MemoryScope.PROJECT
+                    for m in memories
+                ]
+            })
+        return _ERR_MEMORY
+    
+    async def _resource_verification_history(self) -> str:
+        """hermetic://verification/history"""
+        if self.platform.memory_system:
+            verifications = await asyncio.to_thread(
+                self.platform.memory_system.search,
+                query="Verification",
+                memory_type=MemoryType.VERIFICATION,
+                limit=20
+            )
+            return _dumps({
+                "count": len(verifications),
+                "verifications": [
+                    {
+                        "id": v.id,
+                        "content": v.content,
+                        "metadata": v.metadata,
+                        "created": v.created_at
                     }
-                    
-                    entry = self.platform.memory_system.store(
-                        content=arguments["content"],
-                        memory_type=type_map[arguments["memory_type"]],
-                        scope=scope_map.get(arguments.get("scope", "project"), MemoryScope.PROJECT),
-                        metadata=arguments.get("metadata", {})
-                    )
-                    
-                    return [TextContent(type="text", text=json.dumps({
-                        "success": True,
-                        "entry_id": entry.id,
-                        "stored_at": entry.created_at
-                    }, indent=2))]
-                
-                elif name == "detect_project":
-                    path = arguments.get("path", os.getcwd())
-                    context = self.platform.project_detector.detect_project(path)
-                    
-                    return [TextContent(type="text", text=json.dumps({
-                        "project_hash": context.project_hash,
-                        "project_path": context.project_path,
-                        "project_type": context.project_type,
-                        "is_new": context.is_new,
-                        "created_at": context.created_at.isoformat(),
-                        "last_accessed": context.last_accessed.isoformat()
-                    }, indent=2))]
-                
-                elif name == "get_platform_status":
-                    status = self.platform.get_platform_status()
-                    return [TextContent(type="text", text=json.dumps(status, indent=2))]
-                
-                elif name == "generate_forensic_report":
-                    result = self.verifier.generate_forensic_report(arguments["code"])
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-                
-                else:
-                    return [TextContent(type="text", text=json.dumps({"error": f"Unknown tool: {name}"}))]
-                    
-            except Exception as e:
-                # Tool execution error - return error response
-                return [TextContent(type="text", text=json.dumps({
-                    "error": str(e),
-                    "tool": name
-                }))]
+                    for v in verifications
+                ]
+            })
+        return _ERR_MEMORY
+    
+    async def _tool_sequential_thinking(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        """Process a sequential thinking step"""
+        result = self.platform.sequential_thinking.process_thought(arguments)
+        self._status_cache = None
+        return [TextContent(type="text", text=_dumps(result))]
+    
+    async def _tool_verify_code(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        """Verify a piece of code"""
+        result = await asyncio.to_thread(
+            self.verifier.verify_code,
+            code=arguments["code"],
+            file_path=arguments.get("file_path"),
+            language=arguments.get("language", "python")
+        )
+        return [TextContent(type="text", text=_dumps(result))]
+    
+    async def _tool_verify_with_skepticism(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        """Verify code over several skeptical runs"""
+        runs = arguments.get("runs", 3)
+        if type(runs) is not int or not 1 <= runs <= _MAX_SKEPTICISM_RUNS:
+            raise ValueError(f"runs must be an integer between 1 and {_MAX_SKEPTICISM_RUNS}")
+        
+        result = await asyncio.to_thread(
+            self.verifier.verify_with_skepticism,
+            code=arguments["code"],
+            runs=runs
+        )
+        return [TextContent(type="text", text=_dumps(result))]
+    
+    async def _tool_search_memory(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        """Search platform memory"""
+        if not self.platform.memory_system:
+            return [TextContent(type="text", text=_ERR_MEMORY)]
+        
+        memories = await asyncio.to_thread(
+            self.platform.memory_system.search,
+            query=arguments["query"],
+            scope=_SCOPE_MAP.get(arguments.get("scope", "all")),
+            memory_type=_TYPE_MAP.get(arguments.get("memory_type")),
+            limit=arguments.get("limit", 10)
+        )
+        
+        result = {
+            "count": len(memories),
+            "memories": [
+                {
+                    "id": m.id,
+                    "scope": m.scope_value,
+                    "type": m.type_value,
+                    "content": m.content,
+                    "metadata": m.metadata,
+                    "created": m.created_at,
+                    "confidence": m.confidence_score
+                }
+                for m in memories
+            ]
+        }
+        return [TextContent(type="text", text=_dumps(result))]
+    
+    async def _tool_store_memory(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        """Store an entry in platform memory"""
+        if not self.platform.memory_system:
+            return [TextContent(type="text", text=_ERR_MEMORY)]
+        
+        entry = self.platform.memory_system.store(
+            content=arguments["content"],
+            memory_type=_TYPE_MAP[arguments["memory_type"]],
+            scope=_STORE_SCOPE_MAP.get(arguments.get("scope", "project"), MemoryScope.PROJECT),
+            metadata=arguments.get("metadata", {})
+        )
+        self._status_cache = None
+        
+        return [TextContent(type="text", text=_dumps({
+            "success": True,
+            "entry_id": entry.id,
+            "stored_at": entry.created_at
+        }))]
+    
+    async def _tool_detect_project(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        """Detect the project at a path"""
+        path = arguments.get("path", self._cwd)
+        context = self.platform.project_detector.detect_project(path)
+        self._status_cache = None
+        
+        return [TextContent(type="text", text=_dumps({
+            "project_hash": context.project_hash,
+            "project_path": context.project_path,
+            "project_type": context.project_type,
+            "is_new": context.is_new,
+            "created_at": context.created_at,
+            "last_accessed": context.last_accessed
+        }))]
+    
+    async def _tool_get_platform_status(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        """Report the platform status"""
+        return [TextContent(type="text", text=self._status_json())]
+    
+    async def _tool_generate_forensic_report(self, arguments: Dict[str, Any]) -> List[TextContent]:
+        """Generate a forensic report for code"""
+        result = await asyncio.to_thread(self.verifier.generate_forensic_report, arguments["code"])
+        return [TextContent(type="text", text=_dumps(result))]
     
     async def run(self):
         """Run the MCP server"""
         # Starting Hermetic AI MCP Server
         
-        # Initialize platform
+        # Initialize platform once, before serving, so tool calls never race
+        # a second initialization; verification results go to its memory
         self.platform = HermeticAIPlatform(auto_detect=True)
-        self.verifier = CodeVerifier()
+        self.verifier = CodeVerifier(memory_system=self.platform.memory_system)
         
-        # Run the server
+        # Auto-detect project if in a project directory
+        self.session_id = self.platform.on_session_start(self._cwd)
+        self._status_cache = None
+        
+        # Run the server; shut the platform down however it stops, so
+        # buffered thoughts and registry updates are written
         options = self.server.create_initialization_options()
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                options,
-                raise_exceptions=True
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    options,
+                    raise_exceptions=True
+                )
+        finally:
+            await self.platform.shutdown()
+
+
+def run_async(main: Any) -> Any:
+    """Run a coroutine to completion on uvloop when installed, else on the default asyncio loop"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
 
 
 async def async_main():
@@ -465,8 +585,17 @@ def configure_claude():
                 }
             }
             
-            with open(config_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Write a temp file and swap it in (atomic replace), so a crash
+            # can't leave the user's Claude config truncated. Replace the real
+            # file so a symlinked config stays a symlink, and keep its mode
+            # (configs can hold tokens); the temp file starts out private
+            target = config_path.resolve()
+            tmp_file = target.with_name(target.name + ".tmp")
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(_dumps(config))
+            shutil.copymode(target, tmp_file)
+            os.replace(tmp_file, target)
             
             print(f"✓ Configured {config_path}")
             configured = True
@@ -491,7 +620,7 @@ def main():
         sys.exit(0)
     
     try:
-        asyncio.run(async_main())
+        run_async(async_main())
     except KeyboardInterrupt:
         # Server shutdown requested
         pass
@@ -15,17 +15,13 @@ sys.path.insert(0, str(project_root))
 import warnings
 warnings.filterwarnings("ignore")
 
-# Disable any print statements from imported modules
-import builtins
-_original_print = builtins.print
-def silent_print(*args, **kwargs):
-    # Only allow printing to stdout, never to stderr
-    if kwargs.get('file') != sys.stderr:
-        _original_print(*args, **kwargs)
-builtins.print = silent_print
+# Send stderr to devnull at the fd level: prints to stderr, logging and
+# C-level writes are all dropped, with no per-print overhead
+_devnull = os.open(os.devnull, os.O_WRONLY)
+os.dup2(_devnull, 2)
+os.close(_devnull)
 
-from hermetic_ai_mcp.server import HermeticMCPServer
-import asyncio
+from hermetic_ai_mcp.server import HermeticMCPServer, run_async
 
 def main():
     """Main entry point for the MCP server"""
@@ -37,7 +33,7 @@ def main():
     
     try:
         # Run the async server
-        asyncio.run(server.run())
+        run_async(server.run())
     except KeyboardInterrupt:
         # Silent shutdown
         pass
@@ -26,13 +26,14 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/private/hermetic-ai-mcp",
     packages=find_packages(exclude=["tests", "tests.*", "docs", "docs.*"]),
-    python_requires=">=3.9",
+    python_requires=">=3.10",
     install_requires=requirements,
     extras_require={
         "dev": [
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.4.0",
+            "pytest>=7.0.0",
         ],
         "docs": [
             "mkdocs>=1.5.0",
@@ -41,6 +42,9 @@ setup(
         "lsp": [
             "pylsp-server>=1.8.0",
             "python-lsp-jsonrpc>=1.1.0",
+        ],
+        "re2": [
+            "google-re2>=1.1",
         ]
     },
     entry_points={
@@ -59,7 +63,6 @@ setup(
         "Topic :: Scientific/Engineering :: Artificial Intelligence",
         "License :: Other/Proprietary License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
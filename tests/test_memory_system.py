@@ -0,0 +1,94 @@
+"""
+Tests for DualLayerMemorySystem.store_many and list_recent
+"""
+import pytest
+
+from hermetic_ai_mcp.core.memory_system import DualLayerMemorySystem, MemoryScope, MemoryType
+
+
+@pytest.fixture
+def memory(tmp_path):
+    memory = DualLayerMemorySystem(str(tmp_path / "memory"))
+    memory.set_project("project-a")
+    yield memory
+    memory.close()
+
+
+def _count(conn, table):
+    return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_store_many_stores_in_order(memory):
+    entries = memory.store_many([
+        ("first", MemoryType.THOUGHT, MemoryScope.PROJECT, None),
+        ("second", MemoryType.COMMAND, MemoryScope.UNIVERSAL, {"description": "d"}),
+        ("third", MemoryType.VERIFICATION, MemoryScope.PROJECT, {"code_hash": "abc"}),
+    ])
+
+    assert [entry.content for entry in entries] == ["first", "second", "third"]
+    assert _count(memory.project_conn, "project_memories") == 2
+    assert _count(memory.project_conn, "verification_history") == 1
+    assert _count(memory.universal_conn, "command_library") == 1
+
+
+def test_store_many_is_all_or_nothing(memory):
+    unserializable = {"value": object()}
+
+    with pytest.raises(TypeError):
+        memory.store_many([
+            ("kept?", MemoryType.COMMAND, MemoryScope.UNIVERSAL, None),
+            ("kept?", MemoryType.THOUGHT, MemoryScope.PROJECT, None),
+            # First INSERT (verification_history) succeeds, the second fails
+            ("broken", MemoryType.VERIFICATION, MemoryScope.PROJECT, unserializable),
+        ])
+
+    # A later commit on the same connections must not save any of the batch
+    memory.store("after", MemoryType.THOUGHT, MemoryScope.PROJECT)
+    memory.store("after", MemoryType.ERROR, MemoryScope.UNIVERSAL)
+
+    assert _count(memory.project_conn, "verification_history") == 0
+    assert _count(memory.project_conn, "project_memories") == 1
+    assert _count(memory.universal_conn, "command_library") == 0
+    assert _count(memory.universal_conn, "memories") == 1
+    assert [entry.content for entry in memory._project_cache.values()] == ["after"]
+    assert [entry.content for entry in memory._universal_cache.values()] == ["after"]
+
+
+def test_store_many_requires_project_before_storing(tmp_path):
+    memory = DualLayerMemorySystem(str(tmp_path / "memory"))
+    try:
+        with pytest.raises(ValueError):
+            memory.store_many([
+                ("universal", MemoryType.COMMAND, MemoryScope.UNIVERSAL, None),
+                ("project", MemoryType.THOUGHT, MemoryScope.PROJECT, None),
+            ])
+        assert _count(memory.universal_conn, "memories") == 0
+    finally:
+        memory.close()
+
+
+def test_store_many_promotes_after_commit(memory):
+    memory.promotion_threshold = 1
+
+    memory.store_many([("shared pattern", MemoryType.PATTERN, MemoryScope.PROJECT, None)])
+
+    promoted = memory.list_recent(scope=MemoryScope.UNIVERSAL)
+    assert [entry.content for entry in promoted] == ["shared pattern"]
+
+
+def test_list_recent_is_newest_first_and_scoped(memory):
+    for index in range(3):
+        memory.store(f"project {index}", MemoryType.THOUGHT, MemoryScope.PROJECT)
+        memory.store(f"universal {index}", MemoryType.COMMAND, MemoryScope.UNIVERSAL)
+
+    recent = memory.list_recent(limit=4)
+    assert [entry.created_at for entry in recent] == sorted(
+        (entry.created_at for entry in recent), reverse=True
+    )
+    assert len(recent) == 4
+
+    project_only = memory.list_recent(scope=MemoryScope.PROJECT, limit=10)
+    assert {entry.content for entry in project_only} == {"project 0", "project 1", "project 2"}
+
+    commands = memory.list_recent(memory_type=MemoryType.COMMAND, limit=10)
+    assert {entry.content for entry in commands} == {"universal 0", "universal 1", "universal 2"}
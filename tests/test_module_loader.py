@@ -0,0 +1,95 @@
+"""
+Tests for ModuleLoader.load_modules_parallel
+"""
+import json
+import textwrap
+
+from hermetic_ai_mcp.core.module_loader import ModuleLoader
+
+
+def _write_module(modules_dir, name, dependencies=(), fail=False):
+    """Write an external module that records its initialization on the platform list"""
+    module_dir = modules_dir / name
+    module_dir.mkdir()
+    (module_dir / "module.json").write_text(json.dumps({
+        "name": name,
+        "version": "1.0.0",
+        "description": f"Test module {name}",
+        "author": "tests",
+        "dependencies": list(dependencies),
+        "entry_point": name
+    }))
+    (module_dir / "__init__.py").write_text(textwrap.dedent(f"""
+        from hermetic_ai_mcp.core.module_loader import ModuleInterface, hermetic_module
+
+        class Helper(ModuleInterface):
+            def initialize(self):
+                raise AssertionError("helper class must not be used as the entry class")
+
+        @hermetic_module
+        class Entry(ModuleInterface):
+            def initialize(self):
+                self.platform.append({name!r})
+                return {not fail!r}
+    """))
+
+
+def _loader(tmp_path, modules):
+    modules_dir = tmp_path / "modules"
+    modules_dir.mkdir()
+    for name, dependencies, fail in modules:
+        _write_module(modules_dir, name, dependencies, fail)
+    loader = ModuleLoader(str(modules_dir))
+    loader.discover_modules()
+    return loader
+
+
+def test_dependencies_load_first(tmp_path):
+    loader = _loader(tmp_path, [
+        ("app", ["db", "cache"], False),
+        ("db", ["base"], False),
+        ("cache", ["base"], False),
+        ("base", [], False),
+    ])
+    order = []
+
+    loaded = loader.load_modules_parallel(["app"], platform=order)
+
+    assert list(loaded) == ["app"]
+    assert set(loader.loaded_modules) == {"app", "db", "cache", "base"}
+    assert order[0] == "base"
+    assert set(order[1:3]) == {"db", "cache"}
+    assert order[3] == "app"
+
+
+def test_failed_dependency_skips_dependents(tmp_path):
+    loader = _loader(tmp_path, [
+        ("app", ["db"], False),
+        ("db", ["base"], True),
+        ("base", [], False),
+        ("other", [], False),
+    ])
+    order = []
+
+    loaded = loader.load_modules_parallel(["app", "other"], platform=order)
+
+    assert list(loaded) == ["other"]
+    assert "app" not in order
+    assert loader.module_errors["db"] == "Module initialization failed"
+    assert loader.module_errors["app"] == "Dependency db failed to load"
+
+
+def test_cycle_is_reported(tmp_path):
+    loader = _loader(tmp_path, [
+        ("left", ["right"], False),
+        ("right", ["left"], False),
+        ("free", [], False),
+    ])
+    order = []
+
+    loaded = loader.load_modules_parallel(["left", "free"], platform=order)
+
+    assert list(loaded) == ["free"]
+    assert order == ["free"]
+    assert loader.module_errors["left"] == "Dependency cycle detected"
+    assert loader.module_errors["right"] == "Dependency cycle detected"
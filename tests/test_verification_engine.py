@@ -0,0 +1,60 @@
+"""
+Tests for CodeVerifier.verify_many
+"""
+import uuid
+
+import pytest
+
+from hermetic_ai_mcp.core.verification_engine import CodeVerifier
+
+
+def _items():
+    # Unique code per run so the shared verification cache can't answer for verify_many
+    tag = uuid.uuid4().hex
+    passing = f"x = {tag!r}\n"
+    failing = f"mock_obj = {tag!r}\n"
+    other = f"def f():\n    pass\n# {tag}\n"
+    return [
+        (passing, None, "python"),
+        (failing, None, "python"),
+        (passing, None, "python"),
+        (other, "src/m.py", "python"),
+        (failing, None, "python"),
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_results_follow_input_order(max_workers):
+    verifier = CodeVerifier(strict_mode=False)
+    items = _items()
+
+    results = verifier.verify_many(items, max_workers=max_workers)
+
+    assert len(results) == len(items)
+    for (code, file_path, language), result in zip(items, results):
+        expected = verifier.verify_code(code, file_path, language, force=True)
+        assert result["code_hash"] == expected["code_hash"]
+        assert result["passed"] == expected["passed"]
+        assert result["violations"] == expected["violations"]
+    assert [result["passed"] for result in results] == [True, False, True, False, False]
+
+
+def test_duplicates_share_one_result():
+    verifier = CodeVerifier(strict_mode=False)
+    items = _items()
+
+    results = verifier.verify_many(items, max_workers=2)
+
+    assert results[0] is results[2]
+    assert results[1] is results[4]
+    assert results[0] is not results[1]
+
+
+def test_cached_results_are_reused():
+    verifier = CodeVerifier(strict_mode=False)
+    items = _items()
+
+    first = verifier.verify_many(items, max_workers=1)
+    second = verifier.verify_many(items, max_workers=1)
+
+    assert all(a is b for a, b in zip(first, second))